@@ -43,10 +43,11 @@ Categorías:
     7. Inflación y expectativas
     8. Amplitud / participación cross-asset
 
-Entrada:  data/processed/market_monthly.csv
-          data/processed/macro_monthly.csv
+Entrada:  data/processed/market_monthly.parquet (o .csv)
+          data/processed/macro_monthly.parquet  (o .csv)
 Salida:   data/indicators/
           ├── indicators_full.csv
+          ├── indicators_full.parquet  (copia para regime_selector)
           └── indicators_metadata.csv
 
 Autor: Mauro Calvo Pérez y Jorge Fernández Beloso
@@ -55,6 +56,8 @@ Fecha: 2026-02
 """
 
 import logging
+import os
+import tempfile
 from pathlib import Path
 from typing import Optional
 
@@ -91,14 +94,53 @@ MACRO_COLS = [
 # 2. CARGA DE DATOS
 # ══════════════════════════════════════════════════════════════════════════════
 
+def _read_processed(processed_dir: Path, name: str) -> pd.DataFrame:
+    """
+    Lee un dataset del Paso 2 en el formato escrito más recientemente.
+
+    Entre {name}.parquet, {name}.feather y {name}.csv se lee el de mtime
+    más reciente (a igualdad, en ese orden de preferencia): si el Paso 2 se
+    relanza con otro formato (--format csv/feather), los archivos que
+    quedan del formato anterior no ocultan los datos nuevos.
+
+    Parquet y Feather conservan fechas y tipos, sin reparsear. Las columnas
+    estrechas (float32 de versiones anteriores, USREC en Int8) se pasan a
+    float64, como al leer el CSV, para que variaciones y aceleraciones no
+    pierdan precisión y los NaN sean siempre np.nan.
+    """
+    candidates = [
+        path
+        for path in (processed_dir / f"{name}.{ext}" for ext in ("parquet", "feather", "csv"))
+        if path.exists()
+    ]
+    if not candidates:
+        # Sin ningún formato: el error de lectura del CSV, como antes
+        return pd.read_csv(processed_dir / f"{name}.csv", index_col=0, parse_dates=True)
+    # max() devuelve el primero de los empatados: Parquet gana a igualdad
+    filepath = max(candidates, key=lambda path: path.stat().st_mtime_ns)
+
+    if filepath.suffix == ".csv":
+        return pd.read_csv(filepath, index_col=0, parse_dates=True)
+    if filepath.suffix == ".parquet":
+        df = pd.read_parquet(filepath, engine="pyarrow")
+    else:
+        # Feather no guarda índice: la fecha es la primera columna
+        df = pd.read_feather(filepath)
+        df = df.set_index(df.columns[0])
+    narrow_cols = df.select_dtypes(["float32", "Int8"]).columns
+    return df.astype({c: "float64" for c in narrow_cols})
+
+
 def load_processed_data(
     processed_dir: Path = PROCESSED_DATA_DIR,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Carga los datasets procesados del Paso 2.
 
-    Lee market_monthly.csv y macro_monthly.csv, verifica la presencia de
-    las columnas esperadas y reporta cualquier discrepancia.
+    Lee market_monthly y macro_monthly (el formato escrito más
+    recientemente, ver _read_processed),
+    verifica la presencia de las columnas esperadas y reporta cualquier
+    discrepancia.
 
     Retorna
     -------
@@ -106,11 +148,8 @@ def load_processed_data(
     """
     logger.info("Cargando datos procesados...")
 
-    market_path = processed_dir / "market_monthly.csv"
-    macro_path = processed_dir / "macro_monthly.csv"
-
-    market = pd.read_csv(market_path, index_col=0, parse_dates=True)
-    macro = pd.read_csv(macro_path, index_col=0, parse_dates=True)
+    market = _read_processed(processed_dir, "market_monthly")
+    macro = _read_processed(processed_dir, "macro_monthly")
 
     # Verificar columnas
     for col in MARKET_COLS:
@@ -1488,6 +1527,9 @@ def save_indicators(
 
     Archivos generados:
     - indicators_full.csv     → Todos los indicadores (filas = meses)
+    - indicators_full.parquet → Copia del anterior que lee
+                                regime_selector.load_indicators con tipos y
+                                fechas ya resueltos
     - indicators_metadata.csv → Metadatos (filas = indicadores)
     """
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -1500,6 +1542,24 @@ def save_indicators(
     logger.info(f"  ✓ {path_ind.name}: {indicators_df.shape[0]} filas × "
                 f"{indicators_df.shape[1]} cols")
 
+    # Copia Parquet: se escribe después del CSV (load_indicators solo la usa
+    # si es más reciente que él) y de forma atómica, a un temporal propio
+    # renombrado con os.replace, para que nunca se lea una copia a medias.
+    # Índice en resolución us, la misma que da la lectura del CSV.
+    path_pq = path_ind.with_suffix(".parquet")
+    fd, tmp_name = tempfile.mkstemp(dir=output_dir, prefix=f".{path_pq.name}.")
+    os.close(fd)
+    try:
+        indicators_df.set_axis(indicators_df.index.as_unit("us")).to_parquet(
+            tmp_name, engine="pyarrow"
+        )
+        os.replace(tmp_name, path_pq)
+    finally:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+    files["indicators_full_parquet"] = path_pq
+    logger.info(f"  ✓ {path_pq.name}: copia de {path_ind.name}")
+
     path_meta = output_dir / "indicators_metadata.csv"
     metadata_df.to_csv(path_meta)
     files["indicators_metadata"] = path_meta
@@ -1527,7 +1587,8 @@ def run_indicators(
     Parámetros
     ----------
     processed_dir : Path
-        Directorio con market_monthly.csv y macro_monthly.csv.
+        Directorio con market_monthly y macro_monthly (.parquet por
+        defecto; también .feather o .csv).
     output_dir : Path
         Directorio de salida para indicadores.
 
@@ -1593,7 +1654,7 @@ if __name__ == "__main__":
     Requisitos previos:
         - Haber ejecutado data_loader.py (Paso 1).
         - Haber ejecutado preprocessing.py (Paso 2).
-        - Los archivos market_monthly.csv y macro_monthly.csv deben
-          existir en data/processed/.
+        - Los archivos market_monthly.parquet y macro_monthly.parquet (o
+          sus versiones .feather/.csv) deben existir en data/processed/.
     """
     results = run_indicators()
\ No newline at end of file
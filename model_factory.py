@@ -36,13 +36,13 @@ Fecha: 2026-02
 ================================================================================
 """
 
+import csv
 import logging
 from pathlib import Path
-from typing import Any, Optional
-
-import pandas as pd
+from typing import Any, Collection, Optional
 
 from model_base import BaseModel, LOGIC_REGISTRY, MODELS_DIR, get_available_logics
+from model_loader import list_models
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +54,33 @@ logger = logging.getLogger(__name__)
 INDICATORS_DIR = Path("data/indicators")
 INDICATORS_FILE = "indicators_full.csv"
 
+# Tabla de despacho logic → (clave registrada, clase), indexada tanto por la
+# clave original como por su forma normalizada. Se reconstruye si
+# LOGIC_REGISTRY cambia de tamaño (lógicas registradas en tiempo de ejecución).
+_logic_dispatch: dict[str, tuple[str, type]] = {}
+_logic_dispatch_size = -1
+
+
+def _resolve_logic(logic: str) -> Optional[tuple[str, type]]:
+    """
+    Devuelve (clave, clase) para un tipo de lógica, o None si no existe.
+
+    Acepta la clave exacta o cualquier variante en mayúsculas/espacios.
+    """
+    global _logic_dispatch, _logic_dispatch_size
+    if _logic_dispatch_size != len(LOGIC_REGISTRY):
+        dispatch = {}
+        for key, cls in LOGIC_REGISTRY.items():
+            dispatch[key] = (key, cls)
+            dispatch.setdefault(key.lower().strip(), (key, cls))
+        _logic_dispatch = dispatch
+        _logic_dispatch_size = len(LOGIC_REGISTRY)
+
+    resolved = _logic_dispatch.get(logic)
+    if resolved is None:
+        resolved = _logic_dispatch.get(logic.lower().strip())
+    return resolved
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 # VALIDACIÓN DE INDICADORES
@@ -73,21 +100,46 @@ def _load_available_indicators(
     list[str] : nombres de columna disponibles.
     """
     filepath = indicators_dir / filename
-    if not filepath.exists():
+
+    # Leer solo la línea de cabecera; la primera columna es el índice (fecha)
+    try:
+        with open(filepath, "r", encoding="utf-8", newline="") as f:
+            header = next(csv.reader(f), [])
+    except FileNotFoundError:
         logger.warning(
             f"Archivo de indicadores no encontrado: {filepath}. "
             f"La validación de indicadores se omitirá."
         )
         return []
+    return header[1:]
+
 
-    # Leer solo la primera fila para obtener columnas
-    df_header = pd.read_csv(filepath, index_col=0, nrows=0)
-    return list(df_header.columns)
+class IndicatorContext:
+    """
+    Conjunto de indicadores disponibles cargado una sola vez.
+
+    Pensado para creación masiva de modelos: se pasa a create_model()
+    como `indicator_context` para no releer la cabecera de
+    indicators_full.csv en cada llamada.
+
+    Uso:
+        ctx = IndicatorContext()
+        for spec in specs:
+            create_model(**spec, indicator_context=ctx)
+    """
+
+    def __init__(
+        self,
+        indicators_dir: Path = INDICATORS_DIR,
+        filename: str = INDICATORS_FILE,
+    ):
+        self.available = _load_available_indicators(indicators_dir, filename)
+        self.available_set = frozenset(self.available)
 
 
 def _validate_indicators(
     requested: list[str],
-    available: list[str],
+    available: Collection[str],
 ) -> tuple[list[str], list[str]]:
     """
     Valida que los indicadores solicitados existen.
@@ -114,6 +166,7 @@ def create_model(
     validate_indicators: bool = True,
     save: bool = False,
     models_dir: Path = MODELS_DIR,
+    indicator_context: Optional[IndicatorContext] = None,
 ) -> BaseModel:
     """
     Crea un nuevo modelo de decisión táctica.
@@ -177,6 +230,10 @@ def create_model(
     models_dir : Path
         Directorio donde guardar (si save=True).
 
+    indicator_context : IndicatorContext, opcional
+        Indicadores disponibles ya cargados. Para creación masiva: evita
+        releer indicators_full.csv en cada llamada.
+
     Retorna
     -------
     BaseModel : instancia del modelo creado (subtipo según lógica).
@@ -185,26 +242,41 @@ def create_model(
     ------
     ValueError : si la lógica no existe o los indicadores no son válidos.
     """
-    logger.info("=" * 70)
-    logger.info(f"MODEL FACTORY — Creando modelo '{name}'")
-    logger.info("=" * 70)
+    # Los bloques de log formatean listas y el repr del modelo: se omiten
+    # por completo si INFO está filtrado (p.ej. en barridos de parámetros).
+    log_info = logger.isEnabledFor(logging.INFO)
+
+    if log_info:
+        logger.info("=" * 70)
+        logger.info(f"MODEL FACTORY — Creando modelo '{name}'")
+        logger.info("=" * 70)
 
     # --- 1. Validar tipo de lógica ---
-    logic = logic.lower().strip()
-    if logic not in LOGIC_REGISTRY:
+    resolved = _resolve_logic(logic)
+    if resolved is None:
         raise ValueError(
-            f"Tipo de lógica '{logic}' no reconocido. "
+            f"Tipo de lógica '{logic.lower().strip()}' no reconocido. "
             f"Opciones disponibles: {get_available_logics()}"
         )
+    logic, ModelClass = resolved
 
-    logger.info(f"  Lógica: {logic}")
-    logger.info(f"  Indicadores solicitados: {indicators}")
+    if log_info:
+        logger.info(f"  Lógica: {logic}")
+        logger.info(f"  Indicadores solicitados: {indicators}")
 
     # --- 2. Validar indicadores ---
-    if validate_indicators:
-        available = _load_available_indicators()
+    # Sin indicadores no hay nada que validar: se evita leer el CSV y el
+    # error correspondiente lo lanza BaseModel al instanciar.
+    if validate_indicators and not indicators:
+        logger.warning("  ⚠ Lista de indicadores vacía: validación omitida")
+    elif validate_indicators:
+        if indicator_context is None:
+            indicator_context = IndicatorContext()
+        available = indicator_context.available
         if available:
-            valid, missing = _validate_indicators(indicators, available)
+            valid, missing = _validate_indicators(
+                indicators, indicator_context.available_set
+            )
             if missing:
                 raise ValueError(
                     f"Indicadores no encontrados en indicators_full.csv: {missing}. "
@@ -219,8 +291,6 @@ def create_model(
             )
 
     # --- 3. Instanciar modelo ---
-    ModelClass = LOGIC_REGISTRY[logic]
-
     try:
         model = ModelClass(
             name=name,
@@ -231,9 +301,10 @@ def create_model(
     except (ValueError, KeyError) as e:
         raise ValueError(f"Error creando modelo '{name}': {e}")
 
-    logger.info(f"  ✓ Modelo '{name}' creado exitosamente")
-    logger.info(f"  Tipo: {model.__class__.__name__}")
-    logger.info(f"  Repr: {model}")
+    if log_info:
+        logger.info(f"  ✓ Modelo '{name}' creado exitosamente")
+        logger.info(f"  Tipo: {model.__class__.__name__}")
+        logger.info(f"  Repr: {model}")
 
     # --- 4. Guardar si solicitado ---
     if save:
@@ -260,14 +331,15 @@ def list_available_indicators(
     return available
 
 
-def list_saved_models(models_dir: Path = MODELS_DIR) -> list[str]:
+def list_saved_models(models_dir: Path = MODELS_DIR, *, sort: bool = True) -> list[str]:
     """
     Lista los nombres de modelos guardados en disco.
 
+    Delega en model_loader.list_models (listado cacheado por mtime).
+    Con sort=False se devuelven sin ordenar.
+
     Retorna
     -------
     list[str] : nombres de modelos (sin extensión .json).
     """
-    if not models_dir.exists():
-        return []
-    return sorted(p.stem for p in models_dir.glob("*.json"))
\ No newline at end of file
+    return list_models(models_dir, sort=sort)
\ No newline at end of file
@@ -28,6 +28,9 @@ Fecha: 2026-02
 
 import json
 import logging
+import mmap
+import os
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -37,6 +40,30 @@ from model_base import BaseModel, LOGIC_REGISTRY, MODELS_DIR
 
 logger = logging.getLogger(__name__)
 
+# Parser JSON: orjson (C, opcional) si está instalado; si no, stdlib json.
+# Ambos reciben los bytes crudos del archivo.
+try:
+    import orjson
+    _loads = orjson.loads
+    _HAS_ORJSON = True
+except ImportError:
+    def _loads(data: bytes):
+        return json.loads(data.decode("utf-8"))
+    _HAS_ORJSON = False
+
+# Tamaño a partir del cual inspect_model mapea el archivo en memoria (mmap)
+# en lugar de copiarlo a bytes. Por debajo, la syscall extra no compensa.
+_MMAP_MIN_BYTES = 4096
+
+# Caché de listados de directorio: {models_dir: (st_mtime_ns, nombres)}.
+# El mtime del directorio cambia al crear/borrar archivos, lo que invalida
+# la entrada automáticamente.
+_list_cache: dict[Path, tuple[int, list[str]]] = {}
+_list_cache_lock = threading.Lock()
+
+# Campos obligatorios en el JSON de un modelo.
+_REQUIRED_FIELDS = frozenset(("name", "indicators", "logic_type", "parameters"))
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 # FUNCIÓN PRINCIPAL: load_model
@@ -74,26 +101,25 @@ def load_model(
     """
     filepath = models_dir / f"{name}.json"
 
-    if not filepath.exists():
+    # --- Leer JSON ---
+    try:
+        raw = filepath.read_bytes()
+    except FileNotFoundError as e:
         available = list_models(models_dir)
         raise FileNotFoundError(
             f"Modelo '{name}' no encontrado en {models_dir}. "
             f"Modelos disponibles: {available}"
-        )
-
-    # --- Leer JSON ---
-    with open(filepath, "r", encoding="utf-8") as f:
-        model_dict = json.load(f)
+        ) from e
+    model_dict = _loads(raw)
 
     logger.info(f"Cargando modelo '{name}' desde {filepath}")
 
     # --- Validar campos requeridos ---
-    required_fields = ["name", "indicators", "logic_type", "parameters"]
-    for field in required_fields:
-        if field not in model_dict:
-            raise ValueError(
-                f"Archivo de modelo corrupto: falta campo '{field}' en {filepath}"
-            )
+    missing = _REQUIRED_FIELDS - model_dict.keys()
+    if missing:
+        raise ValueError(
+            f"Archivo de modelo corrupto: faltan campos {sorted(missing)} en {filepath}"
+        )
 
     # --- Buscar clase de lógica ---
     logic_type = model_dict["logic_type"]
@@ -118,12 +144,13 @@ def load_model(
     if "created_at" in model_dict:
         model.created_at = model_dict["created_at"]
 
-    logger.info(
-        f"  ✓ Modelo '{name}' cargado | "
-        f"lógica={logic_type} | "
-        f"{len(model.indicators)} indicadores | "
-        f"creado={model.created_at}"
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            f"  ✓ Modelo '{name}' cargado | "
+            f"lógica={logic_type} | "
+            f"{len(model.indicators)} indicadores | "
+            f"creado={model.created_at}"
+        )
 
     return model
 
@@ -132,17 +159,44 @@ def load_model(
 # FUNCIONES AUXILIARES
 # ══════════════════════════════════════════════════════════════════════════════
 
-def list_models(models_dir: Path = MODELS_DIR) -> list[str]:
+def list_models(models_dir: Path = MODELS_DIR, *, sort: bool = True) -> list[str]:
     """
     Lista todos los modelos guardados en disco.
 
+    El listado se cachea por directorio y solo se vuelve a escanear
+    cuando cambia el mtime del directorio.
+
+    Parámetros
+    ----------
+    models_dir : Path
+        Directorio de modelos.
+    sort : bool
+        Si False, devuelve los nombres en orden de directorio (sin ordenar).
+
     Retorna
     -------
     list[str] : nombres de modelos disponibles (sin extensión).
     """
-    if not models_dir.exists():
+    try:
+        mtime = models_dir.stat().st_mtime_ns
+    except FileNotFoundError:
         return []
-    return sorted(p.stem for p in models_dir.glob("*.json"))
+
+    with _list_cache_lock:
+        cached = _list_cache.get(models_dir)
+    if cached is not None and cached[0] == mtime:
+        names = cached[1]
+    else:
+        # os.scandir evita crear un Path por entrada; el nombre se recorta
+        # directamente quitando la extensión ".json" (5 caracteres).
+        with os.scandir(models_dir) as it:
+            names = [
+                e.name[:-5] for e in it if e.name.endswith(".json") and e.is_file()
+            ]
+        with _list_cache_lock:
+            _list_cache[models_dir] = (mtime, names)
+
+    return sorted(names) if sort else list(names)
 
 
 def inspect_model(
@@ -167,11 +221,26 @@ def inspect_model(
     """
     filepath = models_dir / f"{name}.json"
 
-    if not filepath.exists():
-        raise FileNotFoundError(f"Modelo '{name}' no encontrado en {models_dir}")
+    try:
+        return _read_json_mapped(filepath)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Modelo '{name}' no encontrado en {models_dir}") from e
+
 
-    with open(filepath, "r", encoding="utf-8") as f:
-        return json.load(f)
+def _read_json_mapped(filepath: Path) -> dict:
+    """
+    Lee un JSON decodificándolo directamente desde un mmap del archivo.
+
+    Solo se usa mmap con orjson (acepta memoryview sin copiar) y para
+    archivos de al menos _MMAP_MIN_BYTES; en otro caso se lee a bytes.
+    """
+    with open(filepath, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if not _HAS_ORJSON or size < _MMAP_MIN_BYTES:
+            return _loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return _loads(view)
 
 
 def load_all_models(
@@ -184,7 +253,7 @@ def load_all_models(
     -------
     dict[str, BaseModel] : {nombre: instancia} de cada modelo.
     """
-    names = list_models(models_dir)
+    names = list_models(models_dir, sort=False)
     models = {}
 
     for name in names:
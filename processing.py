@@ -65,20 +65,31 @@ Decisiones metodológicas clave:
 
 Entrada:  data/raw/  (archivos CSV del data_loader.py)
 Salida:   data/processed/
-          ├── market_monthly.csv
-          ├── macro_monthly.csv
-          ├── combined_monthly_raw.csv
-          └── audit_report.csv
+          ├── market_monthly.parquet   (+ .csv con write_csv=True)
+          ├── macro_monthly.parquet    (+ .csv con write_csv=True)
+          ├── combined_monthly_raw.parquet (+ .csv con write_csv=True)
+          └── audit_report.feather     (+ .csv con verbose=True)
+          Cada dataset lleva una huella {nombre}.sha: si los datos no cambian
+          entre ejecuciones, no se reescribe.
 
 Autor: Mauro Calvo Pérez y Jorge Fernández Beloso
 Fecha: 2026-02
 ================================================================================
 """
 
+import csv
+import functools
+import hashlib
+import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Callable, Mapping, NamedTuple, Optional
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 
 # ──────────────────────────────────────────────────────────────────────────────
 # CONFIGURACIÓN DE LOGGING
@@ -98,6 +109,12 @@ logger = logging.getLogger(__name__)
 RAW_DATA_DIR = Path("data/raw")
 PROCESSED_DATA_DIR = Path("data/processed")
 
+# Precisión de las columnas float al cargar los raw. Se mantiene float64:
+# los indicadores toman diferencias mes a mes de niveles grandes (CPI,
+# INDPRO) y en float32 el redondeo se amplifica hasta ~1% relativo. Al
+# persistir solo se estrechan enteros y texto (ver _downcast).
+RAW_FLOAT_DTYPE = "float64"
+
 # ---------------------------------------------------------------------------
 # Archivos de mercado generados por data_loader.py
 # Mapeo: nombre_archivo → { columna principal a extraer, método de resampling }
@@ -167,6 +184,10 @@ MARKET_FILES: dict[str, dict] = {
 #   - "last" → último valor del mes (tasas, spreads).
 #   - "mean" → media mensual (alternativa, no usada aquí).
 #
+# "dtype" (opcional): tipo con el que se carga la serie en lugar de
+#   RAW_FLOAT_DTYPE. USREC es binaria (0/1): se guarda como Int8 nullable
+#   (1 byte + máscara de NaN) en vez de float.
+#
 # Nota sobre USREC: se incluye con flag "lagged_publication" para recordar
 # que esta serie tiene retraso de publicación y NO debe usarse como señal
 # prospectiva en backtesting sin ajustar el lag.
@@ -226,6 +247,7 @@ FRED_FILES: dict[str, dict] = {
         "output_name": "USREC",
         "description": "Recesión NBER — binaria mensual (RETRASO PUBLICACIÓN)",
         "lagged_publication": True,
+        "dtype": "Int8",
     },
     "fred_T10YIE": {
         "native_freq": "daily",
@@ -242,10 +264,98 @@ FRED_FILES: dict[str, dict] = {
 }
 
 
+# ---------------------------------------------------------------------------
+# Especificaciones planas derivadas de los mapeos anteriores.
+#
+# Los bucles de auditoría y procesamiento iteran sobre FileSpec (acceso por
+# atributo) en lugar de indexar el dict de configuración en cada etapa.
+# MARKET_FILES y FRED_FILES se mantienen como fuente legible y por
+# compatibilidad con código que los importe o los pase como argumento.
+#
+# Los valores por defecto de las funciones son vistas de solo lectura
+# (MARKET_FILES_RO, FRED_FILES_RO): no hay default mutable ni rama
+# `if x is None`, y las especificaciones por defecto se reutilizan tal cual.
+# ---------------------------------------------------------------------------
+class FileSpec(NamedTuple):
+    filename: str
+    output_name: str
+    column: Optional[str]
+    resample_method: Optional[str]
+    native_freq: Optional[str]
+    dtype: Optional[str] = None
+
+
+def _build_specs(files: Mapping[str, dict]) -> tuple[FileSpec, ...]:
+    """Convierte un mapeo nombre_archivo → config en una tupla de FileSpec."""
+    return tuple(
+        FileSpec(
+            filename=filename,
+            output_name=config["output_name"],
+            column=config.get("column"),
+            resample_method=config.get("resample_method"),
+            native_freq=config.get("native_freq"),
+            dtype=config.get("dtype"),
+        )
+        for filename, config in files.items()
+    )
+
+
+MARKET_FILES_RO: Mapping[str, dict] = MappingProxyType(MARKET_FILES)
+FRED_FILES_RO: Mapping[str, dict] = MappingProxyType(FRED_FILES)
+
+MARKET_SPECS: tuple[FileSpec, ...] = _build_specs(MARKET_FILES)
+FRED_SPECS: tuple[FileSpec, ...] = _build_specs(FRED_FILES)
+
+_DEFAULT_SPECS = ((MARKET_FILES_RO, MARKET_SPECS), (FRED_FILES_RO, FRED_SPECS))
+
+
+def _specs_for(files: Mapping[str, dict]) -> tuple[FileSpec, ...]:
+    """FileSpec de un mapeo: las precalculadas si es un mapeo por defecto."""
+    for default_files, default_specs in _DEFAULT_SPECS:
+        if files is default_files:
+            return default_specs
+    return _build_specs(files)
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # 2. AUDITORÍA DE DATOS RAW
 # ══════════════════════════════════════════════════════════════════════════════
 
+def _read_raw(filepath: Path) -> pd.DataFrame:
+    """
+    Lee un CSV raw con el lector multihilo de pyarrow.
+
+    La primera columna (fecha) se usa como índice y se convierte a
+    DatetimeIndex con caché de fechas repetidas. Los valores no se tocan.
+
+    La fecha se lee como texto y la parsea pd.to_datetime: pyarrow pasaría
+    a UTC las fechas con offset ("2020-02-01 00:00:00+01:00" → 2020-01-31
+    23:00) y, al quitar la zona en load_and_normalize_index, la
+    observación caería en el mes anterior. Así se conserva la hora local,
+    como con el lector de pandas.
+
+    El resultado se cachea por (ruta, mtime): la auditoría y el
+    procesamiento comparten un único parseo por archivo, y si el archivo
+    cambia en disco se vuelve a leer. El DataFrame devuelto es compartido,
+    así que los llamadores NO deben modificarlo in-place.
+    """
+    return _read_raw_cached(str(filepath), filepath.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=64)
+def _read_raw_cached(path: str, mtime_ns: int) -> pd.DataFrame:
+    """Parseo real de _read_raw; mtime_ns solo forma parte de la clave."""
+    with open(path, newline="", encoding="utf-8") as fh:
+        index_col = next(csv.reader(fh))[0]
+    table = pa_csv.read_csv(
+        path,
+        convert_options=pa_csv.ConvertOptions(column_types={index_col: pa.string()}),
+    )
+    df = table.to_pandas().set_index(index_col)
+    df.index = pd.to_datetime(df.index, cache=True)
+    return df
+
+
 def audit_raw_file(filepath: Path) -> dict:
     """
     Realiza una auditoría básica de un archivo CSV raw.
@@ -274,7 +384,7 @@ def audit_raw_file(filepath: Path) -> dict:
         return audit
 
     try:
-        df = pd.read_csv(filepath, index_col=0, parse_dates=True)
+        df = _read_raw(filepath)
     except Exception as e:
         logger.error(f"  ✗ Error leyendo {filepath.name}: {e}")
         audit["error"] = str(e)
@@ -287,13 +397,16 @@ def audit_raw_file(filepath: Path) -> dict:
     audit["date_max"] = str(df.index.max().date()) if len(df) > 0 else None
 
     # --- Duplicados en el índice temporal ---
-    n_duplicates = df.index.duplicated().sum()
+    # has_duplicates está cacheado en el índice: el recuento completo solo
+    # se hace si realmente hay duplicados.
+    n_duplicates = df.index.duplicated().sum() if df.index.has_duplicates else 0
     audit["index_duplicates"] = int(n_duplicates)
 
     # --- NaNs por columna ---
-    nan_counts = df.isna().sum().to_dict()
-    audit["nans_per_column"] = nan_counts
-    audit["total_nans"] = int(df.isna().sum().sum())
+    # Una sola máscara isna(): el total se obtiene de los recuentos por columna
+    nan_counts = df.isna().sum()
+    audit["nans_per_column"] = nan_counts.to_dict()
+    audit["total_nans"] = int(nan_counts.sum())
 
     # --- Frecuencia inferida ---
     # pd.infer_freq intenta detectar la frecuencia del índice temporal.
@@ -307,8 +420,8 @@ def audit_raw_file(filepath: Path) -> dict:
     # --- Frecuencia estimada por mediana de diferencias ---
     # Más robusto que infer_freq para series con gaps (festivos, fines de semana).
     if len(df) > 1:
-        median_delta = df.index.to_series().diff().median()
-        audit["median_delta_days"] = median_delta.days
+        median_delta = np.median(np.diff(df.index.to_numpy()))
+        audit["median_delta_days"] = int(median_delta // np.timedelta64(1, "D"))
     else:
         audit["median_delta_days"] = None
 
@@ -317,8 +430,8 @@ def audit_raw_file(filepath: Path) -> dict:
 
 def run_full_audit(
     raw_dir: Path = RAW_DATA_DIR,
-    market_files: dict = None,
-    fred_files: dict = None,
+    market_files: Mapping[str, dict] = MARKET_FILES_RO,
+    fred_files: Mapping[str, dict] = FRED_FILES_RO,
 ) -> pd.DataFrame:
     """
     Ejecuta la auditoría completa sobre todos los archivos raw.
@@ -330,19 +443,19 @@ def run_full_audit(
     ----------
     raw_dir : Path
         Directorio de datos raw.
-    market_files : dict
-        Mapeo de archivos de mercado. Por defecto MARKET_FILES.
-    fred_files : dict
-        Mapeo de archivos FRED. Por defecto FRED_FILES.
+    market_files : Mapping
+        Mapeo de archivos de mercado. Por defecto MARKET_FILES_RO
+        (se usa MARKET_SPECS, ya precalculado).
+    fred_files : Mapping
+        Mapeo de archivos FRED. Por defecto FRED_FILES_RO
+        (se usa FRED_SPECS, ya precalculado).
 
     Retorna
     -------
     pd.DataFrame : tabla de auditoría con una fila por archivo.
     """
-    if market_files is None:
-        market_files = MARKET_FILES
-    if fred_files is None:
-        fred_files = FRED_FILES
+    market_specs = _specs_for(market_files)
+    fred_specs = _specs_for(fred_files)
 
     logger.info("=" * 70)
     logger.info("AUDITORÍA DE DATOS RAW")
@@ -352,16 +465,15 @@ def run_full_audit(
 
     # Auditar archivos de mercado
     logger.info("--- Archivos de mercado (yfinance) ---")
-    for filename, config in market_files.items():
-        filepath = raw_dir / f"{filename}.csv"
-        audit = audit_raw_file(filepath)
+    for spec in market_specs:
+        audit = audit_raw_file(raw_dir / f"{spec.filename}.csv")
         audit["source"] = "yfinance"
-        audit["output_name"] = config["output_name"]
+        audit["output_name"] = spec.output_name
         all_audits.append(audit)
 
         if "error" not in audit:
             logger.info(
-                f"  {config['output_name']:>8s} | "
+                f"  {spec.output_name:>8s} | "
                 f"{audit['rows']:>6d} filas | "
                 f"{audit['date_min']} → {audit['date_max']} | "
                 f"NaNs: {audit['total_nans']:>5d} | "
@@ -371,22 +483,21 @@ def run_full_audit(
 
     # Auditar archivos FRED
     logger.info("--- Archivos macroeconómicos (FRED) ---")
-    for filename, config in fred_files.items():
-        filepath = raw_dir / f"{filename}.csv"
-        audit = audit_raw_file(filepath)
+    for spec in fred_specs:
+        audit = audit_raw_file(raw_dir / f"{spec.filename}.csv")
         audit["source"] = "FRED"
-        audit["output_name"] = config["output_name"]
-        audit["native_freq"] = config["native_freq"]
+        audit["output_name"] = spec.output_name
+        audit["native_freq"] = spec.native_freq
         all_audits.append(audit)
 
         if "error" not in audit:
             logger.info(
-                f"  {config['output_name']:>8s} | "
+                f"  {spec.output_name:>8s} | "
                 f"{audit['rows']:>6d} filas | "
                 f"{audit['date_min']} → {audit['date_max']} | "
                 f"NaNs: {audit['total_nans']:>5d} | "
                 f"Δ mediana: {audit['median_delta_days']}d | "
-                f"native: {config['native_freq']}"
+                f"native: {spec.native_freq}"
             )
 
     # Construir tabla de auditoría
@@ -400,7 +511,10 @@ def run_full_audit(
 # 3. CARGA Y NORMALIZACIÓN DE ÍNDICE TEMPORAL
 # ══════════════════════════════════════════════════════════════════════════════
 
-def load_and_normalize_index(filepath: Path) -> pd.DataFrame:
+def load_and_normalize_index(
+    filepath: Path,
+    float_dtype: Optional[str] = RAW_FLOAT_DTYPE,
+) -> pd.DataFrame:
     """
     Carga un CSV raw y normaliza su índice temporal.
 
@@ -412,40 +526,59 @@ def load_and_normalize_index(filepath: Path) -> pd.DataFrame:
        y complicaría los merges.
     3. Eliminar filas con índice duplicado (conservar la primera).
        Justificación: duplicados son errores de la fuente, no datos reales.
-    4. Ordenar cronológicamente.
+    4. Ordenar cronológicamente (solo si el índice no está ya ordenado).
+    5. Convertir las columnas float64 a float_dtype (por defecto
+       RAW_FLOAT_DTYPE, float64: sin cambios). Las columnas enteras (p.ej.
+       Volume) se mantienen.
 
     NO se hace:
     - Forward-fill de valores.
     - Eliminación de NaNs en columnas de datos.
-    - Ninguna transformación de valores.
+    - Ninguna transformación de valores (más allá de la precisión).
 
     Parámetros
     ----------
     filepath : Path
         Ruta al archivo CSV.
+    float_dtype : str, opcional
+        Tipo para las columnas float64. None para no convertirlas (p.ej.
+        cuando el llamador aplica su propio tipo, como Int8 para USREC).
 
     Retorna
     -------
     pd.DataFrame : DataFrame con índice temporal normalizado.
     """
-    df = pd.read_csv(filepath, index_col=0, parse_dates=True)
+    df = _read_raw(filepath)
+
+    # El DataFrame leído está cacheado y es compartido con la auditoría:
+    # todas las operaciones siguientes devuelven objetos nuevos.
 
     # --- Eliminar timezone info ---
     if df.index.tz is not None:
         logger.info(f"    Eliminando timezone ({df.index.tz}) del índice.")
-        df.index = df.index.tz_localize(None)
+        df = df.tz_localize(None)
 
     # --- Eliminar duplicados en índice ---
-    n_dup = df.index.duplicated().sum()
-    if n_dup > 0:
-        logger.info(f"    Eliminando {n_dup} filas con fecha duplicada.")
-        df = df[~df.index.duplicated(keep="first")]
+    # has_duplicates es O(1) una vez calculado (cacheado en el índice); la
+    # máscara solo se construye, una vez, si hay algo que eliminar.
+    if df.index.has_duplicates:
+        dup_mask = df.index.duplicated(keep="first")
+        logger.info(f"    Eliminando {dup_mask.sum()} filas con fecha duplicada.")
+        df = df[~dup_mask]
 
     # --- Ordenar cronológicamente ---
-    df = df.sort_index()
+    # Los raw se escriben en orden cronológico: comprobar la monotonía es
+    # una pasada O(n) y evita el sort (y la copia) en el caso habitual.
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
+
+    # --- Reducir precisión de columnas float ---
+    float_cols = df.select_dtypes("float64").columns
+    if float_dtype is not None and len(float_cols) > 0:
+        df = df.astype({col: float_dtype for col in float_cols})
 
     # --- Asegurar que el índice tiene nombre ---
-    df.index.name = "date"
+    df = df.rename_axis("date")
 
     return df
 
@@ -455,12 +588,15 @@ def load_and_normalize_index(filepath: Path) -> pd.DataFrame:
 # ══════════════════════════════════════════════════════════════════════════════
 
 def resample_to_monthly(
-    series: pd.Series,
+    series: pd.Series | pd.DataFrame,
     method: str = "last",
-) -> pd.Series:
+) -> pd.Series | pd.DataFrame:
     """
     Convierte una serie temporal (diaria o irregular) a frecuencia mensual.
 
+    Acepta también un DataFrame: cada columna se agrega de forma
+    independiente en una sola pasada.
+
     El resampling se hace al mes calendario completo ("ME" = Month End),
     lo que asigna cada observación al mes al que pertenece.
 
@@ -477,25 +613,36 @@ def resample_to_monthly(
 
     Parámetros
     ----------
-    series : pd.Series
-        Serie temporal con DatetimeIndex.
+    series : pd.Series o pd.DataFrame
+        Serie temporal (o varias, como columnas) con DatetimeIndex.
     method : str
         "last" o "mean".
 
     Retorna
     -------
-    pd.Series : serie resampleada a frecuencia mensual (Month End).
+    pd.Series o pd.DataFrame : resampleado a frecuencia mensual (Month End).
     """
-    resampler = series.resample("ME")
-
-    if method == "last":
-        result = resampler.last()
-    elif method == "mean":
-        result = resampler.mean()
-    else:
+    if method not in ("last", "mean"):
         raise ValueError(f"Método de resampling no soportado: {method}")
 
-    return result
+    # Agrupar por una clave entera de mes (truncado a datetime64[M]) evita
+    # la generación de bins de resample(); el resultado es el mismo.
+    month_key = series.index.to_numpy().astype("datetime64[M]")
+    grouped = series.groupby(month_key, sort=True)
+    result = grouped.last() if method == "last" else grouped.mean()
+
+    # Etiquetar cada mes con su último día y, como resample("ME"), incluir
+    # con NaN los meses intermedios sin ninguna observación. La clave
+    # datetime64[M] vuelve en resolución de segundos: se restaura la del
+    # índice de entrada, como hace resample.
+    unit = series.index.unit
+    month_end = pd.DatetimeIndex(result.index).as_unit(unit) + pd.offsets.MonthEnd(0)
+    result = result.set_axis(month_end)
+    if len(result) > 0:
+        full_range = pd.date_range(month_end[0], month_end[-1], freq="ME", unit=unit)
+        result = result.reindex(full_range)
+
+    return result.rename_axis(series.index.name)
 
 
 def normalize_monthly_index(series: pd.Series) -> pd.Series:
@@ -520,19 +667,155 @@ def normalize_monthly_index(series: pd.Series) -> pd.Series:
     -------
     pd.Series : misma serie con índice al último día de cada mes.
     """
-    # to_period('M') agrupa por mes; to_timestamp('M') devuelve fin de mes.
-    # Esto unifica tanto series con fecha al inicio como al final del mes.
-    series.index = series.index.to_period("M").to_timestamp("M")
-    return series
+    index = series.index
+
+    # Índice ya a fin de mes y sin hora (p.ej. una serie que ya pasó por
+    # aquí): no hay nada que mover. Ambas comprobaciones son vectorizadas.
+    if isinstance(index, pd.DatetimeIndex) and index.is_normalized and index.is_month_end.all():
+        return series
+
+    # normalize() elimina la hora; MonthEnd(0) lleva cada fecha al fin de su
+    # mes (y deja igual las que ya lo son). Unifica series con fecha al
+    # inicio o al final del mes, sin pasar por objetos Period.
+    month_end = index.normalize() + pd.offsets.MonthEnd(0)
+    return series.set_axis(month_end)
+
+
+def _resample_batch(
+    daily: dict[str, pd.Series],
+    methods: dict[str, str],
+) -> dict[str, pd.Series]:
+    """
+    Resamplea varias series a mensual con una pasada por método.
+
+    Las series que comparten método se unen (outer join) en un DataFrame
+    ancho y se resamplean juntas. Después, cada columna se recorta a su
+    propio rango de meses, de modo que el resultado es idéntico al de
+    resamplear cada serie por separado.
+
+    Parámetros
+    ----------
+    daily : dict[str, pd.Series]
+        {clave: serie diaria}.
+    methods : dict[str, str]
+        {clave: método de resampling} para cada serie de `daily`.
+
+    Retorna
+    -------
+    dict[str, pd.Series] : {clave: serie mensual}, en el orden de `daily`.
+    """
+    groups: dict[str, list[str]] = {}
+    for key in daily:
+        groups.setdefault(methods[key], []).append(key)
+
+    monthly = {}
+    for method, keys in groups.items():
+        wide = pd.concat([daily[k].rename(k) for k in keys], axis=1, join="outer", sort=True)
+        wide_monthly = resample_to_monthly(wide, method=method)
+        for k in keys:
+            idx = daily[k].index
+            if len(idx) == 0:
+                monthly[k] = wide_monthly[k].iloc[:0]
+                continue
+            first = idx.min().normalize() + pd.offsets.MonthEnd(0)
+            last = idx.max().normalize() + pd.offsets.MonthEnd(0)
+            monthly[k] = wide_monthly[k].loc[first:last]
+
+    return {k: monthly[k] for k in daily}
 
 
 # ══════════════════════════════════════════════════════════════════════════════
 # 5. PROCESAMIENTO DE DATOS DE MERCADO
 # ══════════════════════════════════════════════════════════════════════════════
 
+def _coverage_stats(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Estadísticas de cobertura por columna, calculadas de una vez.
+
+    Construye una única máscara de válidos como array 2D y obtiene todas
+    las estadísticas con reducciones NumPy por columna (axis=0), sin
+    volver a recorrer el DataFrame. Se usa notna() en lugar de np.isnan
+    para admitir columnas nullable (USREC en Int8). Solo se usa para el log.
+
+    Retorna
+    -------
+    pd.DataFrame : una fila por columna con n_valid, n_nan, first_valid
+                   y last_valid (NaT si la columna no tiene datos o el
+                   DataFrame no tiene filas).
+    """
+    valid = df.notna().to_numpy()
+    n_valid = valid.sum(axis=0)
+    if len(df) == 0:
+        # argmax no admite ejes vacíos: sin filas no hay primer/último dato
+        first_valid = last_valid = pd.NaT
+    else:
+        has_data = valid.any(axis=0)
+        first_row = valid.argmax(axis=0)
+        last_row = len(df) - 1 - valid[::-1].argmax(axis=0)
+        first_valid = df.index[first_row].where(has_data)
+        last_valid = df.index[last_row].where(has_data)
+    return pd.DataFrame(
+        {
+            "n_valid": n_valid,
+            "n_nan": len(df) - n_valid,
+            "first_valid": first_valid,
+            "last_valid": last_valid,
+        },
+        index=df.columns,
+    )
+
+
+def _process_market_file(filepath: Path, spec: FileSpec) -> dict:
+    """
+    Carga un único archivo de mercado (se ejecuta en un hilo del pool).
+
+    No escribe en el log: devuelve la serie diaria y sus estadísticas
+    en un dict para que el hilo principal las registre en orden. El
+    resampling se hace después, en bloque (ver _resample_batch).
+
+    Retorna
+    -------
+    dict : con clave "status" ("ok", "missing" o "no_column") y, si "ok",
+           "daily" más las estadísticas diarias.
+    """
+    target_col = spec.column
+    result = {"status": "ok", "daily": None, "matched_col": None}
+
+    # --- Cargar y normalizar ---
+    if not filepath.exists():
+        result["status"] = "missing"
+        return result
+
+    df = load_and_normalize_index(filepath)
+
+    # --- Verificar que la columna objetivo existe ---
+    if target_col not in df.columns:
+        # Intentar buscar la columna sin case-sensitivity
+        col_match = [c for c in df.columns if c.lower() == target_col.lower()]
+        if col_match:
+            target_col = col_match[0]
+            result["matched_col"] = target_col
+        else:
+            result["status"] = "no_column"
+            result["columns"] = list(df.columns)
+            return result
+
+    daily_series = df[target_col]
+
+    result.update(
+        daily=daily_series,
+        n_daily=len(daily_series),
+        n_daily_nans=daily_series.isna().sum(),
+        daily_min=daily_series.index.min(),
+        daily_max=daily_series.index.max(),
+    )
+    return result
+
+
 def process_market_data(
     raw_dir: Path = RAW_DATA_DIR,
-    market_files: dict = None,
+    market_files: Mapping[str, dict] = MARKET_FILES_RO,
+    max_workers: Optional[int] = None,
 ) -> pd.DataFrame:
     """
     Procesa todos los archivos de mercado (yfinance) a frecuencia mensual.
@@ -543,6 +826,11 @@ def process_market_data(
     3. Resamplea de diario a mensual con el método configurado.
     4. Documenta pérdida de datos y cobertura.
 
+    Los archivos son independientes entre sí, así que se cargan en
+    paralelo con un pool de hilos; el log se emite después, en el orden
+    de market_files. El resampling se hace en bloque: una sola pasada por
+    método para todos los tickers que lo comparten.
+
     El DataFrame resultante tiene una columna por ticker y un índice
     mensual (fin de mes).
 
@@ -550,93 +838,88 @@ def process_market_data(
     ----------
     raw_dir : Path
         Directorio de datos raw.
-    market_files : dict
-        Mapeo de configuración. Por defecto MARKET_FILES.
+    market_files : Mapping
+        Mapeo de configuración. Por defecto MARKET_FILES_RO
+        (se usa MARKET_SPECS, ya precalculado).
+    max_workers : int, opcional
+        Número de hilos. Por defecto, el de ThreadPoolExecutor.
 
     Retorna
     -------
     pd.DataFrame : datos de mercado mensuales (columnas = tickers).
     """
-    if market_files is None:
-        market_files = MARKET_FILES
+    specs = _specs_for(market_files)
 
     logger.info("=" * 70)
     logger.info("PROCESAMIENTO DE DATOS DE MERCADO → MENSUAL")
     logger.info("=" * 70)
 
-    monthly_series = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(
+            lambda spec: _process_market_file(raw_dir / f"{spec.filename}.csv", spec),
+            specs,
+        ))
 
-    for filename, config in market_files.items():
+    # --- Resamplear a mensual: una pasada por método para todos los tickers ---
+    monthly_by_file = _resample_batch(
+        {spec.filename: res["daily"] for spec, res in zip(specs, results) if res["status"] == "ok"},
+        {spec.filename: spec.resample_method for spec in specs},
+    )
+
+    monthly_series = []
+
+    for spec, res in zip(specs, results):
+        filename, output_name = spec.filename, spec.output_name
+        target_col, method = spec.column, spec.resample_method
         filepath = raw_dir / f"{filename}.csv"
-        output_name = config["output_name"]
-        target_col = config["column"]
-        method = config["resample_method"]
 
         logger.info(f"\nProcesando {output_name} ({filename}.csv)...")
 
-        # --- Cargar y normalizar ---
-        if not filepath.exists():
+        if res["status"] == "missing":
             logger.warning(f"  ⚠ Archivo no encontrado: {filepath}. Saltando.")
             continue
+        if res["status"] == "no_column":
+            logger.warning(
+                f"  ⚠ Columna '{target_col}' no encontrada en {filename}. "
+                f"Columnas disponibles: {res['columns']}. Saltando."
+            )
+            continue
+        if res["matched_col"] is not None:
+            logger.info(f"    Columna encontrada como '{res['matched_col']}'")
 
-        df = load_and_normalize_index(filepath)
-
-        # --- Verificar que la columna objetivo existe ---
-        if target_col not in df.columns:
-            # Intentar buscar la columna sin case-sensitivity
-            col_match = [c for c in df.columns if c.lower() == target_col.lower()]
-            if col_match:
-                target_col = col_match[0]
-                logger.info(f"    Columna encontrada como '{target_col}'")
-            else:
-                logger.warning(
-                    f"  ⚠ Columna '{target_col}' no encontrada en {filename}. "
-                    f"Columnas disponibles: {list(df.columns)}. Saltando."
-                )
-                continue
-
-        daily_series = df[target_col].copy()
-        n_daily = len(daily_series)
-        n_daily_nans = daily_series.isna().sum()
-
-        # --- Resamplear a mensual ---
-        monthly = resample_to_monthly(daily_series, method=method)
-        n_monthly = len(monthly)
-        n_monthly_nans = monthly.isna().sum()
-
+        monthly = monthly_by_file[filename]
         logger.info(
-            f"    Diario: {n_daily} obs ({n_daily_nans} NaNs) | "
-            f"{daily_series.index.min().date()} → {daily_series.index.max().date()}"
+            f"    Diario: {res['n_daily']} obs ({res['n_daily_nans']} NaNs) | "
+            f"{res['daily_min'].date()} → {res['daily_max'].date()}"
         )
         logger.info(
-            f"    Mensual ({method}): {n_monthly} meses ({n_monthly_nans} NaNs) | "
+            f"    Mensual ({method}): {len(monthly)} meses ({monthly.isna().sum()} NaNs) | "
             f"{monthly.index.min().date()} → {monthly.index.max().date()}"
         )
 
-        monthly.name = output_name
-        monthly_series[output_name] = monthly
+        monthly_series.append(monthly.rename(output_name))
 
     # --- Construir DataFrame consolidado ---
     if not monthly_series:
         logger.error("No se procesó ningún archivo de mercado.")
         return pd.DataFrame()
 
-    # Merge con outer join para no perder meses de series más largas (VIX)
-    market_df = pd.DataFrame(monthly_series)
+    # Merge con outer join para no perder meses de series más largas (VIX).
+    # pd.concat alinea todos los índices en una sola pasada.
+    market_df = pd.concat(monthly_series, axis=1, join="outer", sort=True)
     market_df.index.name = "date"
-    market_df = market_df.sort_index()
+    if not market_df.index.is_monotonic_increasing:
+        market_df = market_df.sort_index()
 
     logger.info(f"\n{'─' * 50}")
     logger.info(f"MARKET_MONTHLY: {market_df.shape[0]} meses × {market_df.shape[1]} series")
     logger.info(f"Rango: {market_df.index.min().date()} → {market_df.index.max().date()}")
     logger.info(f"NaNs totales por columna:")
-    for col in market_df.columns:
-        n_nan = market_df[col].isna().sum()
-        n_valid = market_df[col].notna().sum()
-        first_valid = market_df[col].first_valid_index()
+    for st in _coverage_stats(market_df).itertuples():
+        first_valid = st.first_valid
         logger.info(
-            f"    {col:>6s}: {n_valid:>4d} válidos, {n_nan:>4d} NaNs | "
-            f"primer dato: {first_valid.date() if first_valid is not None else 'N/A'}"
+            f"    {st.Index:>6s}: {st.n_valid:>4d} válidos, {st.n_nan:>4d} NaNs | "
+            f"primer dato: {first_valid.date() if pd.notna(first_valid) else 'N/A'}"
         )
 
     return market_df
@@ -646,9 +929,67 @@ def process_market_data(
 # 6. PROCESAMIENTO DE DATOS MACROECONÓMICOS
 # ══════════════════════════════════════════════════════════════════════════════
 
+def _process_macro_file(filepath: Path, spec: FileSpec) -> dict:
+    """
+    Procesa un único archivo FRED (se ejecuta en un hilo del pool).
+
+    Igual que _process_market_file: no escribe en el log y devuelve las
+    estadísticas en un dict. Las series mensuales se normalizan aquí; las
+    diarias se devuelven en "daily" para resamplearlas en bloque.
+
+    Retorna
+    -------
+    dict : con clave "status" ("ok", "missing", "empty" o "bad_config") y,
+           si "ok", "monthly" (series mensuales) o "daily" (series diarias)
+           más las estadísticas raw.
+    """
+    native_freq = spec.native_freq
+    method = spec.resample_method
+    result = {"status": "ok", "monthly": None, "daily": None}
+
+    # --- Cargar y normalizar ---
+    if not filepath.exists():
+        result["status"] = "missing"
+        return result
+
+    # Si la serie tiene tipo propio (USREC → Int8) se omite la conversión float
+    df = load_and_normalize_index(
+        filepath, float_dtype=RAW_FLOAT_DTYPE if spec.dtype is None else None
+    )
+
+    # Las series FRED individuales tienen una sola columna de datos.
+    # Tomamos la primera columna numérica (ignorando el índice).
+    if df.shape[1] == 0:
+        result["status"] = "empty"
+        return result
+
+    # Usar la primera (y típicamente única) columna
+    raw_series = df.iloc[:, 0]
+    if spec.dtype is not None:
+        raw_series = raw_series.astype(spec.dtype)
+    result.update(
+        n_raw=len(raw_series),
+        n_raw_nans=raw_series.isna().sum(),
+        raw_min=raw_series.index.min(),
+        raw_max=raw_series.index.max(),
+    )
+
+    # --- Procesar según frecuencia nativa ---
+    if native_freq == "daily" and method is not None:
+        # Serie diaria → se resamplea a mensual en bloque (_resample_batch)
+        result["daily"] = raw_series
+    elif native_freq == "monthly":
+        # Serie ya mensual → solo normalizar índice al fin de mes
+        result["monthly"] = normalize_monthly_index(raw_series)
+    else:
+        result["status"] = "bad_config"
+    return result
+
+
 def process_macro_data(
     raw_dir: Path = RAW_DATA_DIR,
-    fred_files: dict = None,
+    fred_files: Mapping[str, dict] = FRED_FILES_RO,
+    max_workers: Optional[int] = None,
 ) -> pd.DataFrame:
     """
     Procesa todos los archivos FRED a frecuencia mensual uniforme.
@@ -659,103 +1000,105 @@ def process_macro_data(
     3. Si ya es mensual → normaliza el índice al fin de mes.
     4. Documenta pérdida de datos y cobertura.
 
+    Como en process_market_data, los archivos se cargan en paralelo
+    con un pool de hilos, las series diarias se resamplean en bloque y
+    el log se emite después, en orden.
+
     Parámetros
     ----------
     raw_dir : Path
         Directorio de datos raw.
-    fred_files : dict
-        Mapeo de configuración. Por defecto FRED_FILES.
+    fred_files : Mapping
+        Mapeo de configuración. Por defecto FRED_FILES_RO
+        (se usa FRED_SPECS, ya precalculado).
+    max_workers : int, opcional
+        Número de hilos. Por defecto, el de ThreadPoolExecutor.
 
     Retorna
     -------
     pd.DataFrame : datos macroeconómicos mensuales (columnas = series FRED).
     """
-    if fred_files is None:
-        fred_files = FRED_FILES
+    specs = _specs_for(fred_files)
 
     logger.info("=" * 70)
     logger.info("PROCESAMIENTO DE DATOS MACROECONÓMICOS → MENSUAL")
     logger.info("=" * 70)
 
-    monthly_series = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(
+            lambda spec: _process_macro_file(raw_dir / f"{spec.filename}.csv", spec),
+            specs,
+        ))
+
+    # --- Resamplear las series diarias: una pasada por método ---
+    resampled = _resample_batch(
+        {spec.filename: res["daily"] for spec, res in zip(specs, results) if res["daily"] is not None},
+        {spec.filename: spec.resample_method for spec in specs},
+    )
+
+    monthly_series = []
 
-    for filename, config in fred_files.items():
+    for spec, res in zip(specs, results):
+        filename, output_name = spec.filename, spec.output_name
+        native_freq, method = spec.native_freq, spec.resample_method
         filepath = raw_dir / f"{filename}.csv"
-        output_name = config["output_name"]
-        native_freq = config["native_freq"]
-        method = config["resample_method"]
 
         logger.info(f"\nProcesando {output_name} ({filename}.csv)...")
 
-        # --- Cargar y normalizar ---
-        if not filepath.exists():
+        if res["status"] == "missing":
             logger.warning(f"  ⚠ Archivo no encontrado: {filepath}. Saltando.")
             continue
-
-        df = load_and_normalize_index(filepath)
-
-        # Las series FRED individuales tienen una sola columna de datos.
-        # Tomamos la primera columna numérica (ignorando el índice).
-        if df.shape[1] == 0:
+        if res["status"] == "empty":
             logger.warning(f"  ⚠ DataFrame vacío para {filename}. Saltando.")
             continue
 
-        # Usar la primera (y típicamente única) columna
-        raw_series = df.iloc[:, 0].copy()
-        n_raw = len(raw_series)
-        n_raw_nans = raw_series.isna().sum()
-
         logger.info(
-            f"    Raw: {n_raw} obs ({n_raw_nans} NaNs) | "
-            f"{raw_series.index.min().date()} → {raw_series.index.max().date()} | "
+            f"    Raw: {res['n_raw']} obs ({res['n_raw_nans']} NaNs) | "
+            f"{res['raw_min'].date()} → {res['raw_max'].date()} | "
             f"freq nativa: {native_freq}"
         )
 
-        # --- Procesar según frecuencia nativa ---
-        if native_freq == "daily" and method is not None:
-            # Serie diaria → resamplear a mensual
-            monthly = resample_to_monthly(raw_series, method=method)
+        if res["status"] == "bad_config":
+            logger.warning(
+                f"  ⚠ Configuración inesperada para {output_name}: "
+                f"freq={native_freq}, method={method}. Saltando."
+            )
+            continue
+
+        if filename in resampled:
+            monthly = resampled[filename]
             logger.info(
                 f"    Resampleado ({method}): {len(monthly)} meses "
                 f"({monthly.isna().sum()} NaNs)"
             )
-        elif native_freq == "monthly":
-            # Serie ya mensual → solo normalizar índice al fin de mes
-            monthly = normalize_monthly_index(raw_series)
+        else:
+            monthly = res["monthly"]
             logger.info(
                 f"    Índice normalizado a fin de mes: {len(monthly)} meses "
                 f"({monthly.isna().sum()} NaNs)"
             )
-        else:
-            logger.warning(
-                f"  ⚠ Configuración inesperada para {output_name}: "
-                f"freq={native_freq}, method={method}. Saltando."
-            )
-            continue
 
-        monthly.name = output_name
-        monthly_series[output_name] = monthly
+        monthly_series.append(monthly.rename(output_name))
 
     # --- Construir DataFrame consolidado ---
     if not monthly_series:
         logger.error("No se procesó ningún archivo FRED.")
         return pd.DataFrame()
 
-    macro_df = pd.DataFrame(monthly_series)
+    macro_df = pd.concat(monthly_series, axis=1, join="outer", sort=True)
     macro_df.index.name = "date"
-    macro_df = macro_df.sort_index()
+    if not macro_df.index.is_monotonic_increasing:
+        macro_df = macro_df.sort_index()
 
     logger.info(f"\n{'─' * 50}")
     logger.info(f"MACRO_MONTHLY: {macro_df.shape[0]} meses × {macro_df.shape[1]} series")
     logger.info(f"Rango: {macro_df.index.min().date()} → {macro_df.index.max().date()}")
     logger.info(f"NaNs totales por columna:")
-    for col in macro_df.columns:
-        n_nan = macro_df[col].isna().sum()
-        n_valid = macro_df[col].notna().sum()
-        first_valid = macro_df[col].first_valid_index()
+    for st in _coverage_stats(macro_df).itertuples():
+        first_valid = st.first_valid
         logger.info(
-            f"    {col:>10s}: {n_valid:>5d} válidos, {n_nan:>5d} NaNs | "
-            f"primer dato: {first_valid.date() if first_valid is not None else 'N/A'}"
+            f"    {st.Index:>10s}: {st.n_valid:>5d} válidos, {st.n_nan:>5d} NaNs | "
+            f"primer dato: {first_valid.date() if pd.notna(first_valid) else 'N/A'}"
         )
 
     # --- Advertencia sobre USREC ---
@@ -814,24 +1157,26 @@ def combine_datasets(
     macro_prefixed = macro_df.add_prefix("MAC_")
 
     # --- Merge con outer join ---
-    combined = market_prefixed.join(macro_prefixed, how="outer")
-    combined.index.name = "date"
-    combined = combined.sort_index()
+    # Ambos índices son fin de mes, únicos y ordenados: un concat alineado
+    # por índice basta y evita la ruta de merge de join().
+    combined = pd.concat([market_prefixed, macro_prefixed], axis=1, join="outer")
+    combined = combined.rename_axis("date")
+    if not combined.index.is_monotonic_increasing:
+        combined = combined.sort_index()
 
     logger.info(f"Dataset combinado: {combined.shape[0]} meses × {combined.shape[1]} columnas")
     logger.info(f"Rango total: {combined.index.min().date()} → {combined.index.max().date()}")
 
     # --- Informe de cobertura cruzada ---
     logger.info("\nCobertura por columna:")
-    for col in combined.columns:
-        n_valid = combined[col].notna().sum()
-        n_total = len(combined)
-        pct = 100 * n_valid / n_total
-        first = combined[col].first_valid_index()
-        last = combined[col].last_valid_index()
+    n_total = len(combined)
+    for st in _coverage_stats(combined).itertuples():
+        pct = 100 * st.n_valid / n_total
+        first, last = st.first_valid, st.last_valid
         logger.info(
-            f"    {col:<20s}: {n_valid:>4d}/{n_total} ({pct:5.1f}%) | "
-            f"{first.date() if first else 'N/A'} → {last.date() if last else 'N/A'}"
+            f"    {st.Index:<20s}: {st.n_valid:>4d}/{n_total} ({pct:5.1f}%) | "
+            f"{first.date() if pd.notna(first) else 'N/A'} → "
+            f"{last.date() if pd.notna(last) else 'N/A'}"
         )
 
     return combined
@@ -841,21 +1186,292 @@ def combine_datasets(
 # 8. PERSISTENCIA — GUARDAR DATASETS PROCESADOS
 # ══════════════════════════════════════════════════════════════════════════════
 
+# Escritura CSV: buffer de 1 MiB y bloques de filas grandes (pocas llamadas
+# write() al disco); fin de línea "\n" fijo en cualquier sistema y fechas
+# con formato explícito (sin inferirlo valor a valor). Los floats se
+# escriben sin float_format, con todos sus dígitos, para que el CSV siga
+# siendo intercambiable con el Parquet al releerlo.
+CSV_WRITE_BUFFER = 1024 * 1024
+CSV_CHUNKSIZE = 50_000
+
+
+def _write_csv(df: pd.DataFrame, path: Path) -> None:
+    """Escribe df como CSV a través de un archivo con buffer grande."""
+    with open(path, "w", buffering=CSV_WRITE_BUFFER, encoding="utf-8", newline="") as fh:
+        df.to_csv(
+            fh,
+            lineterminator="\n",
+            date_format="%Y-%m-%d",
+            chunksize=CSV_CHUNKSIZE,
+        )
+
+
+# Escritores por formato: formato → función (df, ruta). El formato es
+# también la extensión del archivo.
+#   - "parquet" → columnar comprimido (zstd); conserva DatetimeIndex y tipos.
+#   - "feather" → Arrow sin comprimir; el más rápido de leer/escribir. No
+#                 admite índice propio: la fecha se guarda como columna.
+#   - "csv"     → texto, para inspección manual.
+PROCESSED_WRITERS = {
+    "parquet": lambda df, path: df.to_parquet(path, engine="pyarrow", compression="zstd"),
+    "feather": lambda df, path: df.reset_index().to_feather(path),
+    "csv": _write_csv,
+}
+DEFAULT_PROCESSED_FORMAT = "parquet"
+
+
+def save_processed(
+    df: pd.DataFrame,
+    name: str,
+    output_dir: Path = PROCESSED_DATA_DIR,
+    write_csv: bool = False,
+    fmt: str = DEFAULT_PROCESSED_FORMAT,
+) -> Path:
+    """
+    Guarda un dataset procesado en el formato indicado (Parquet por defecto).
+
+    Parquet conserva los tipos (DatetimeIndex, float64, Int8), ocupa bastante
+    menos que CSV y se lee sin reparsear fechas. Con write_csv=True se
+    escribe además {name}.csv para compatibilidad e inspección manual
+    (desactivado por defecto: duplica la E/S).
+
+    Parámetros
+    ----------
+    df : pd.DataFrame
+    name : str
+        Nombre base del archivo (sin extensión).
+    output_dir : Path
+    write_csv : bool
+        Si True, escribe también la copia CSV (si fmt ya es "csv", no hay
+        segunda escritura).
+    fmt : str
+        Formato principal: "parquet", "feather" o "csv".
+
+    Retorna
+    -------
+    Path : ruta del archivo en el formato principal.
+    """
+    if fmt not in PROCESSED_WRITERS:
+        raise ValueError(
+            f"Formato '{fmt}' no soportado. "
+            f"Opciones disponibles: {list(PROCESSED_WRITERS)}"
+        )
+
+    filepath = output_dir / f"{name}.{fmt}"
+    PROCESSED_WRITERS[fmt](df, filepath)
+    if write_csv and fmt != "csv":
+        PROCESSED_WRITERS["csv"](df, output_dir / f"{name}.csv")
+    return filepath
+
+
+def _downcast(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Reduce los tipos de df antes de guardarlo (devuelve un DataFrame nuevo).
+
+    - int64 → el entero más estrecho que contenga los valores.
+    - Texto con valores repetidos (p.ej. source, native_freq del informe
+      de auditoría) → category.
+
+    Los float64 NO se estrechan: el Paso 3 lee estos archivos y en float32
+    las diferencias mes a mes de CPI/INDPRO pierden precisión (ver
+    RAW_FLOAT_DTYPE). Las columnas de listas/dicts (auditoría) y las ya
+    estrechas (Int8) no se tocan.
+    """
+    dtypes = {}
+    for col in df.select_dtypes("int64").columns:
+        dtypes[col] = pd.to_numeric(df[col], downcast="integer").dtype
+    for col in df.select_dtypes(["object", "string"]).columns:
+        values = df[col].dropna()
+        if values.map(type).eq(str).all() and values.nunique() <= len(df) // 2:
+            dtypes[col] = "category"
+    return df.astype(dtypes) if dtypes else df
+
+
+def _object_columns(df: pd.DataFrame) -> pd.Index:
+    """
+    Columnas de dtype object (listas, dicts u objetos mixtos).
+
+    Las columnas de texto con dtype str (por defecto en pandas 3) quedan
+    fuera: no contienen listas ni dicts y se hashean sin pasar por repr.
+    No se usa select_dtypes("object"): en pandas 3 también incluye las
+    columnas str (con aviso de obsolescencia), y exclude="str" no existe en
+    pandas 2.
+    """
+    return df.columns[(df.dtypes == object).to_numpy()]
+
+
+def _write_audit(df: pd.DataFrame, output_dir: Path, write_csv: bool = False) -> Path:
+    """
+    Guarda el informe de auditoría en Feather (y opcionalmente en CSV).
+
+    El informe es pequeño y de tipos mixtos: Feather (Arrow sin comprimir)
+    lo escribe sin formatear texto. Las columnas de dicts (nans_per_column)
+    se guardan como JSON: Arrow las convertiría en un struct con la unión
+    de claves de todas las filas. Las listas (columns) se guardan tal cual.
+    """
+    dict_cols = [
+        col for col in _object_columns(df)
+        if df[col].map(type).eq(dict).any()
+    ]
+    arrow_df = df.assign(
+        **{col: df[col].map(json.dumps, na_action="ignore") for col in dict_cols}
+    )
+
+    filepath = output_dir / "audit_report.feather"
+    arrow_df.reset_index(drop=True).to_feather(filepath)
+    if write_csv:
+        _write_csv(df, output_dir / "audit_report.csv")
+    return filepath
+
+
+# Huella de contenido junto a cada dataset ({name}.sha): si los datos y las
+# opciones de escritura no cambian entre ejecuciones, no se reescribe.
+FINGERPRINT_SUFFIX = ".sha"
+
+
+def _fingerprint(df: pd.DataFrame, *options) -> str:
+    """
+    Huella sha256 de df (valores, índice, columnas y tipos) y de options.
+
+    hash_pandas_object calcula un hash por fila en código vectorizado; las
+    columnas y los tipos se añaden aparte porque no forman parte de él.
+    Las columnas object (listas y dicts del informe de auditoría, que no
+    son hashables) se hashean por su repr.
+    """
+    object_cols = _object_columns(df)
+    if len(object_cols):
+        df = df.assign(**{col: df[col].map(repr) for col in object_cols})
+    digest = hashlib.sha256(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    digest.update(repr((list(df.columns), list(map(str, df.dtypes)), options)).encode())
+    return digest.hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Escritor de cada dataset: nombre → (salidas, escritura). Ambas funciones
+# reciben (name, output_dir, fmt, write_csv, verbose) y escritura además el
+# DataFrame primero. "outputs" lista todas las rutas que produce la escritura
+# (la primera es la principal); _write_one solo omite un dataset si existen
+# todas y su huella coincide.
+#   - Datasets mensuales → save_processed: {name}.{fmt} (+ .csv si write_csv).
+#   - audit_report       → _write_audit: .feather (+ .csv si verbose).
+# ---------------------------------------------------------------------------
+class DatasetWriter(NamedTuple):
+    outputs: Callable[[str, Path, str, bool, bool], list[Path]]
+    write: Callable[[pd.DataFrame, str, Path, str, bool, bool], Path]
+
+
+def _processed_outputs(
+    name: str, output_dir: Path, fmt: str, write_csv: bool, verbose: bool
+) -> list[Path]:
+    paths = [output_dir / f"{name}.{fmt}"]
+    if write_csv and fmt != "csv":
+        paths.append(output_dir / f"{name}.csv")
+    return paths
+
+
+def _audit_outputs(
+    name: str, output_dir: Path, fmt: str, write_csv: bool, verbose: bool
+) -> list[Path]:
+    paths = [output_dir / "audit_report.feather"]
+    if verbose:
+        paths.append(output_dir / "audit_report.csv")
+    return paths
+
+
+PROCESSED_DATASET_WRITER = DatasetWriter(
+    outputs=_processed_outputs,
+    write=lambda df, name, output_dir, fmt, write_csv, verbose: save_processed(
+        df, name, output_dir, write_csv=write_csv, fmt=fmt
+    ),
+)
+AUDIT_DATASET_WRITER = DatasetWriter(
+    outputs=_audit_outputs,
+    write=lambda df, name, output_dir, fmt, write_csv, verbose: _write_audit(
+        df, output_dir, write_csv=verbose
+    ),
+)
+DATASET_WRITERS: Mapping[str, DatasetWriter] = MappingProxyType({
+    "market_monthly": PROCESSED_DATASET_WRITER,
+    "macro_monthly": PROCESSED_DATASET_WRITER,
+    "combined_monthly_raw": PROCESSED_DATASET_WRITER,
+    "audit_report": AUDIT_DATASET_WRITER,
+})
+
+
+def _write_one(
+    name: str,
+    df: pd.DataFrame,
+    output_dir: Path,
+    fmt: str,
+    downcast: bool,
+    verbose: bool = False,
+    skip_unchanged: bool = True,
+    write_csv: bool = False,
+) -> tuple[Path, bool]:
+    """
+    Escribe un dataset (se ejecuta en un hilo del pool).
+
+    Como los workers de procesamiento, no escribe en el log: devuelve la
+    ruta principal y si se ha escrito (False si se omitió por no haber
+    cambios) para que el hilo principal lo registre en orden.
+    """
+    writer = DATASET_WRITERS[name]
+    if downcast:
+        df = _downcast(df)
+
+    # Las rutas de salida recogen las opciones que cambian lo escrito
+    # (formato, copias CSV): forman parte de la huella, y si falta alguna
+    # (p.ej. un .csv borrado) el dataset se reescribe.
+    outputs = writer.outputs(name, output_dir, fmt, write_csv, verbose)
+    sha = _fingerprint(df, [path.name for path in outputs])
+    sha_path = output_dir / f"{name}{FINGERPRINT_SUFFIX}"
+    if (
+        skip_unchanged
+        and all(path.exists() for path in outputs)
+        and sha_path.exists()
+        and sha_path.read_text().strip() == sha
+    ):
+        return outputs[0], False
+
+    # Sin huella mientras se escribe: si la escritura se interrumpe, la
+    # siguiente ejecución no da por buenos archivos a medias.
+    sha_path.unlink(missing_ok=True)
+    writer.write(df, name, output_dir, fmt, write_csv, verbose)
+    sha_path.write_text(sha)
+    return outputs[0], True
+
+
 def save_processed_datasets(
     market_df: pd.DataFrame,
     macro_df: pd.DataFrame,
     combined_df: pd.DataFrame,
     audit_df: pd.DataFrame,
     output_dir: Path = PROCESSED_DATA_DIR,
+    fmt: str = DEFAULT_PROCESSED_FORMAT,
+    downcast: bool = True,
+    max_workers: Optional[int] = None,
+    verbose: bool = False,
+    skip_unchanged: bool = True,
+    write_csv: bool = False,
 ) -> dict[str, Path]:
     """
     Guarda todos los datasets procesados en disco.
 
-    Archivos generados:
-    - market_monthly.csv   → solo datos de mercado (sin prefijo)
-    - macro_monthly.csv    → solo datos macro (sin prefijo)
-    - combined_monthly_raw.csv → ambos combinados (con prefijos MKT_/MAC_)
-    - audit_report.csv     → informe de auditoría de la fase raw
+    Las escrituras son independientes: se hacen en paralelo con un pool de
+    hilos (la serialización en pyarrow y la E/S liberan el GIL). El log se
+    emite después, en el orden de los archivos.
+
+    Junto a cada dataset se guarda {name}.sha, una huella sha256 de su
+    contenido y de las opciones de escritura. En una nueva ejecución con
+    los mismos datos (p.ej. raw sin cambios) el archivo no se reescribe.
+
+    Archivos generados (formato fmt; copia CSV con write_csv=True, ver
+    save_processed):
+    - market_monthly       → solo datos de mercado (sin prefijo)
+    - macro_monthly        → solo datos macro (sin prefijo)
+    - combined_monthly_raw → ambos combinados (con prefijos MKT_/MAC_)
+    - audit_report.feather → informe de auditoría de la fase raw (ver
+                             _write_audit; .csv adicional con verbose=True)
 
     Parámetros
     ----------
@@ -864,6 +1480,24 @@ def save_processed_datasets(
     combined_df : pd.DataFrame
     audit_df : pd.DataFrame
     output_dir : Path
+    fmt : str
+        Formato de los datasets mensuales: "parquet" (por defecto),
+        "feather" o "csv".
+    downcast : bool
+        Si True (por defecto), reduce los tipos antes de guardar (ver
+        _downcast): enteros al tipo mínimo y texto repetido → category.
+        Los float64 se conservan, así que afecta sobre todo al informe de
+        auditoría. False para guardar exactamente los tipos en memoria.
+    max_workers : int, opcional
+        Número de hilos. Por defecto, uno por archivo.
+    verbose : bool
+        Si True, escribe también audit_report.csv para inspección manual.
+    skip_unchanged : bool
+        Si True (por defecto), omite los datasets cuya huella coincide con
+        la de su .sha y cuyos archivos (incluidas las copias CSV) ya
+        existen. False para reescribir todo.
+    write_csv : bool
+        Si True, escribe también {name}.csv de cada dataset mensual.
 
     Retorna
     -------
@@ -884,14 +1518,32 @@ def save_processed_datasets(
     logger.info(f"GUARDANDO DATASETS PROCESADOS → {output_dir}")
     logger.info("=" * 70)
 
+    with ThreadPoolExecutor(max_workers=max_workers or len(files_to_save)) as executor:
+        futures = {
+            name: executor.submit(
+                _write_one,
+                name,
+                df,
+                output_dir,
+                fmt,
+                downcast,
+                verbose,
+                skip_unchanged,
+                write_csv,
+            )
+            for name, df in files_to_save.items()
+        }
+
     for name, df in files_to_save.items():
-        filepath = output_dir / f"{name}.csv"
-        df.to_csv(filepath)
+        filepath, written = futures[name].result()
         saved_files[name] = filepath
-        logger.info(
-            f"  ✓ {filepath.name:<30s} | "
-            f"{df.shape[0]:>5d} filas × {df.shape[1]:>3d} cols"
-        )
+        if written:
+            logger.info(
+                f"  ✓ {filepath.name:<30s} | "
+                f"{df.shape[0]:>5d} filas × {df.shape[1]:>3d} cols"
+            )
+        else:
+            logger.info(f"  ⟳ {filepath.name:<30s} | sin cambios, no se reescribe")
 
     return saved_files
 
@@ -903,6 +1555,8 @@ def save_processed_datasets(
 def run_preprocessing(
     raw_dir: Path = RAW_DATA_DIR,
     output_dir: Path = PROCESSED_DATA_DIR,
+    fmt: str = DEFAULT_PROCESSED_FORMAT,
+    write_csv: bool = False,
 ) -> dict:
     """
     Ejecuta el pipeline completo de preprocesado (Paso 2).
@@ -920,6 +1574,10 @@ def run_preprocessing(
         Directorio con datos raw (salida del data_loader.py).
     output_dir : Path
         Directorio para datasets procesados.
+    fmt : str
+        Formato de los datasets mensuales (ver save_processed_datasets).
+    write_csv : bool
+        Si True, escribe también la copia CSV de cada dataset mensual.
 
     Retorna
     -------
@@ -952,6 +1610,8 @@ def run_preprocessing(
         combined_df=combined_df,
         audit_df=audit_df,
         output_dir=output_dir,
+        fmt=fmt,
+        write_csv=write_csv,
     )
 
     # --- Resumen final ---
@@ -984,10 +1644,29 @@ if __name__ == "__main__":
 
     Uso:
         python preprocessing.py
+        python preprocessing.py --format csv
+        python preprocessing.py --format feather --csv
 
     Requisitos previos:
         - Haber ejecutado data_loader.py (los archivos raw deben existir
           en data/raw/).
         - pip install pandas pyarrow
     """
-    results = run_preprocessing()
\ No newline at end of file
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Paso 2: preprocesado de datos raw.")
+    parser.add_argument(
+        "--format",
+        choices=list(PROCESSED_WRITERS),
+        default=DEFAULT_PROCESSED_FORMAT,
+        help="Formato de los datasets mensuales.",
+    )
+    parser.add_argument(
+        "--csv",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Escribir también la copia CSV de cada dataset mensual.",
+    )
+    args = parser.parse_args()
+
+    results = run_preprocessing(fmt=args.format, write_csv=args.csv)
\ No newline at end of file
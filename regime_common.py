@@ -0,0 +1,346 @@
+"""
+================================================================================
+REGIME COMMON — regime_common.py
+================================================================================
+Proyecto: Análisis de contexto económico-financiero para asignación dinámica
+          en el S&P 500.
+
+Propósito: Núcleos numéricos compartidos por los modelos de régimen
+           (regime_model_*.py).
+
+Contenido:
+    - expanding_zscore_values: z-score expansivo sobre arrays NumPy 1D/2D,
+      en una sola pasada de sumas acumuladas (momentos corridos), sin
+      objetos pandas intermedios.
+    - get_zscores: z-scores expansivos de un conjunto de columnas de un
+      DataFrame de indicadores.
+    - composite_and_classify: z-scores dirigidos, composite y régimen de
+      todos los indicadores de un modelo en una sola llamada.
+    - regime_labels: etiquetas del régimen como Categorical (códigos int8).
+    - log_regime_summary: resumen en el log de la distribución de regímenes.
+    - resolve_indicators: indicadores disponibles/faltantes y vector de
+      direcciones de un modelo, cacheados por conjunto de columnas.
+
+    Los modelos seleccionan sus indicadores, delegan aquí el cálculo y
+    vuelven a envolver el resultado con el índice de fechas.
+
+Autor: Mauro Calvo Pérez y Jorge Fernández Beloso
+Fecha: 2026-02
+================================================================================
+"""
+
+import functools
+import logging
+from typing import Mapping, NamedTuple, Sequence
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 1. Z-SCORE EXPANSIVO
+# ══════════════════════════════════════════════════════════════════════════════
+
+def expanding_zscore_values(values: np.ndarray, min_periods: int = 24) -> np.ndarray:
+    """
+    Z-score expansivo por columna sobre un array 1D o 2D (filas = fechas).
+
+    z_t = (X_t - mean(X_1..X_t)) / std(X_1..X_t),  std con ddof=1
+
+    Equivale a expanding(min_periods).mean()/.std(ddof=1) de pandas con
+    desviación nula → NaN, pero con momentos corridos: n, Σd y Σd² se
+    obtienen con tres np.cumsum sobre todo el array (O(n), vectorizado).
+
+    Para estabilidad numérica cada columna se desplaza por su primer valor
+    válido (d = X - X_primero) antes de acumular: la media y la varianza no
+    cambian, se evita la cancelación de Σx² - n·media² cuando la media es
+    grande frente a la dispersión, y un tramo inicial constante da una
+    varianza exactamente 0.
+
+    Los NaN no cuentan como observación (igual que en pandas) y su z-score
+    es NaN. También es NaN mientras haya menos de min_periods observaciones;
+    las columnas que no llegan a min_periods en toda la muestra (indicadores
+    sin datos o aún sin historia) se devuelven enteras en NaN sin calcular.
+
+    Parámetros
+    ----------
+    values : np.ndarray
+        Datos en float, 1D (una serie) o 2D (una columna por serie).
+    min_periods : int
+        Mínimo de observaciones válidas para calcular el z-score.
+
+    Retorna
+    -------
+    np.ndarray : z-scores con la misma forma que values.
+    """
+    x = np.asarray(values, dtype=np.float64)
+    # Menos filas que min_periods: ninguna columna puede llegar, todo NaN
+    if len(x) < max(min_periods, 1):
+        return np.full(x.shape, np.nan)
+    x2d = x.reshape(len(x), -1)
+
+    valid = ~np.isnan(x2d)
+
+    # Columnas que nunca alcanzan min_periods: todo NaN, sin sumas acumuladas
+    enough = valid.sum(axis=0) >= max(min_periods, 1)
+    if not enough.all():
+        z = np.full(x2d.shape, np.nan)
+        if enough.any():
+            z[:, enough] = expanding_zscore_values(x2d[:, enough], min_periods)
+        return z.reshape(x.shape)
+
+    first_row = valid.argmax(axis=0)
+    shift = x2d[first_row, np.arange(x2d.shape[1])]
+    shift = np.where(valid.any(axis=0), shift, 0.0)
+
+    # Las operaciones intermedias reutilizan buffers (out=) en lugar de
+    # crear un array por paso: d, Σd² y la varianza se calculan in situ.
+    d = np.subtract(x2d, shift)
+    d[~valid] = 0.0
+
+    n = np.cumsum(valid, axis=0)
+    sum_d = np.cumsum(d, axis=0)
+    sum_d2 = np.square(d)
+    np.cumsum(sum_d2, axis=0, out=sum_d2)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_d = sum_d / n
+        # Σ(d - media)² = Σd² - media·Σd; negativo solo por redondeo → 0
+        var = np.multiply(mean_d, sum_d, out=sum_d)
+        np.subtract(sum_d2, var, out=var)
+        np.maximum(var, 0.0, out=var)
+        np.divide(var, n - 1, out=var)
+    std = np.sqrt(var, out=var)
+
+    # Todas las condiciones de NaN en la máscara de la división: se divide
+    # solo donde std > 0 (False también para std NaN), el valor es válido y
+    # hay min_periods observaciones; el resto conserva el NaN inicial.
+    computable = std > 0
+    computable &= valid
+    computable &= n >= max(min_periods, 1)
+    z = np.full_like(d, np.nan)
+    np.subtract(d, mean_d, out=d)
+    np.divide(d, std, out=z, where=computable)
+    return z.reshape(x.shape)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 2. Z-SCORES DE UN CONJUNTO DE COLUMNAS
+# ══════════════════════════════════════════════════════════════════════════════
+
+def get_zscores(
+    indicators: pd.DataFrame,
+    cols: Sequence[str],
+    min_periods: int = 24,
+) -> np.ndarray:
+    """
+    Z-scores expansivos de las columnas cols de indicators (matriz T×N).
+
+    Todas las columnas se calculan juntas en una sola llamada a
+    expanding_zscore_values. No hay caché entre llamadas: los datos se leen
+    del DataFrame cada vez, así que reasignar una columna se refleja en la
+    siguiente clasificación. Con menos de min_periods filas el resultado es
+    todo NaN y se devuelve sin leer datos.
+
+    Parámetros
+    ----------
+    indicators : pd.DataFrame
+        DataFrame de indicadores (filas = fechas).
+    cols : Sequence[str]
+        Columnas a devolver, en este orden.
+    min_periods : int
+        Mínimo de observaciones para el z-score expansivo.
+
+    Retorna
+    -------
+    np.ndarray : matriz T×len(cols) de z-scores (sin dirección aplicada).
+    """
+    if len(indicators) < max(min_periods, 1):
+        return np.full((len(indicators), len(cols)), np.nan)
+
+    values = indicators[list(cols)].to_numpy(dtype=np.float64)
+    if logger.isEnabledFor(logging.DEBUG):
+        n_obs = (~np.isnan(values)).sum(axis=0)
+        for col, n in zip(cols, n_obs):
+            if n < min_periods:
+                logger.debug(
+                    f"  z-score omitido: {col} ({n} obs. < min_periods={min_periods})"
+                )
+    return expanding_zscore_values(values, min_periods)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 3. COMPOSITE Y CLASIFICACIÓN
+# ══════════════════════════════════════════════════════════════════════════════
+
+def composite_and_classify(
+    zscores: np.ndarray,
+    directions: np.ndarray,
+    upper_threshold: float,
+    lower_threshold: float,
+) -> tuple[np.ndarray, np.ndarray, pd.arrays.IntegerArray]:
+    """
+    Z-scores dirigidos, composite y régimen en una sola llamada sobre arrays.
+
+    Reúne los tres pasos comunes a los modelos de régimen:
+    1. Z-score expansivo de cada columna (ver get_zscores), multiplicado
+       por su dirección.
+    2. Composite = media de los z-scores dirigidos disponibles en cada
+       fecha (ignorando NaN; NaN si no hay ninguno).
+    3. Régimen: 1 si composite > upper_threshold, -1 si < lower_threshold,
+       0 en otro caso y <NA> donde el composite es NaN. Se devuelve como
+       entero nullable Int8 (1 byte por fecha más la máscara de nulos), no
+       como float64 con NaN.
+
+    Parámetros
+    ----------
+    zscores : np.ndarray
+        Matriz T×N de z-scores expansivos (filas = fechas, columnas =
+        indicadores), p.ej. de get_zscores.
+    directions : np.ndarray
+        Vector de N direcciones (+1/-1), en el orden de las columnas.
+    upper_threshold, lower_threshold : float
+        Umbrales del composite para los regímenes 1 y -1.
+
+    Retorna
+    -------
+    tuple : (z-scores dirigidos T×N, composite T, régimen T en Int8)
+    """
+    directed = zscores * directions
+
+    # Media por fila ignorando NaN, equivalente a DataFrame.mean(axis=1):
+    # suma y recuento de válidos en dos reducciones; las filas sin ningún
+    # z-score válido quedan en NaN (sin división 0/0 ni avisos).
+    n_valid = (~np.isnan(directed)).sum(axis=1)
+    composite = np.full(len(directed), np.nan)
+    np.divide(np.nansum(directed, axis=1), n_valid, out=composite, where=n_valid > 0)
+
+    # Una sola selección vectorizada directamente en int8; las comparaciones
+    # con NaN son False (quedan en 0) y la máscara de nulos las marca <NA>
+    regime_values = np.select(
+        [composite > upper_threshold, composite < lower_threshold],
+        [np.int8(1), np.int8(-1)],
+        default=np.int8(0),
+    )
+    regime = pd.arrays.IntegerArray(regime_values, np.isnan(composite))
+
+    return directed, composite, regime
+
+
+def regime_labels(regime: pd.arrays.IntegerArray, labels: Mapping[int, str]) -> pd.Categorical:
+    """
+    Etiquetas de régimen como Categorical construido desde códigos.
+
+    El régimen (-1, 0, 1; <NA> sin dato) se traslada a códigos 0, 1, 2
+    (-1 para <NA>) con una operación vectorizada, sin buscar cada fila en
+    el diccionario: 1 byte por fila en lugar de un objeto str.
+
+    Parámetros
+    ----------
+    regime : pd.arrays.IntegerArray
+        Régimen en Int8 (-1, 0, 1 o <NA>), p.ej. de composite_and_classify.
+    labels : Mapping[int, str]
+        Etiqueta de cada régimen (REGIME_LABELS del modelo).
+
+    Retorna
+    -------
+    pd.Categorical : con categorías [labels[-1], labels[0], labels[1]].
+    """
+    codes = (regime + 1).to_numpy(dtype=np.int8, na_value=-1)
+    return pd.Categorical.from_codes(codes, categories=[labels[-1], labels[0], labels[1]])
+
+
+def log_regime_summary(
+    model_logger: logging.Logger,
+    model_name: str,
+    regime: pd.Series,
+    labels: Mapping[int, str],
+    label_width: int = 12,
+) -> None:
+    """
+    Registra la distribución de regímenes (meses y % por valor).
+
+    Se escribe en el logger del modelo para conservar su nombre en los
+    registros. Los recuentos salen de un np.bincount sobre régimen + 1
+    (una pasada, sin tabla hash ni ordenación); solo se listan los
+    regímenes presentes. Si INFO está filtrado no se calcula nada.
+
+    Parámetros
+    ----------
+    model_logger : logging.Logger
+        Logger del modelo que llama.
+    model_name : str
+        Prefijo de cada línea (MODEL_NAME del modelo).
+    regime : pd.Series
+        Régimen (-1, 0, 1; nulos ignorados).
+    labels : Mapping[int, str]
+        Etiqueta de cada régimen (REGIME_LABELS del modelo).
+    label_width : int
+        Ancho de la columna de etiquetas.
+    """
+    if not model_logger.isEnabledFor(logging.INFO):
+        return
+
+    values = regime.dropna().to_numpy(dtype=np.int8)
+    total = len(values)
+    if total == 0:
+        return
+
+    counts = np.bincount(values + 1, minlength=3)
+    model_logger.info(f"[{model_name}] Clasificación completada ({total} meses válidos):")
+    for val, count in enumerate(counts, start=-1):
+        if count == 0:
+            continue
+        label = labels.get(val, "unknown")
+        pct = 100 * count / total
+        model_logger.info(
+            f"[{model_name}]   {int(val):+d} ({label:>{label_width}s}): "
+            f"{count:>4d} meses ({pct:5.1f}%)"
+        )
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 4. RESOLUCIÓN DE INDICADORES
+# ══════════════════════════════════════════════════════════════════════════════
+
+class ResolvedIndicators(NamedTuple):
+    """Indicadores de un modelo frente a las columnas de un DataFrame."""
+    available: tuple[str, ...]
+    missing: tuple[str, ...]
+    directions: np.ndarray  # int8 de solo lectura, en el orden de available
+
+
+@functools.lru_cache(maxsize=32)
+def resolve_indicators(
+    spec: tuple[tuple[str, int], ...],
+    columns: frozenset[str],
+) -> ResolvedIndicators:
+    """
+    Separa los indicadores de un modelo en disponibles y faltantes.
+
+    El resultado se cachea por (spec, columns): en llamadas repetidas con
+    el mismo conjunto de columnas (backtests, ventanas walk-forward) no se
+    repiten las comprobaciones de pertenencia ni se reconstruyen las
+    listas. Es inmutable (tuplas y array de solo lectura), así que se
+    puede compartir entre llamadas.
+
+    Parámetros
+    ----------
+    spec : tuple[tuple[str, int], ...]
+        Pares (indicador, dirección) del modelo: tuple(INDICATORS.items()).
+    columns : frozenset[str]
+        Columnas del DataFrame de indicadores: frozenset(indicators.columns).
+        Sirve a la vez de clave de la caché y de conjunto para comprobar
+        pertenencia; el llamador puede reutilizarlo para otras columnas.
+
+    Retorna
+    -------
+    ResolvedIndicators : (available, missing, directions).
+    """
+    available = tuple(col for col, _ in spec if col in columns)
+    missing = tuple(col for col, _ in spec if col not in columns)
+    directions = np.array([d for col, d in spec if col in columns], dtype=np.int8)
+    directions.flags.writeable = False
+    return ResolvedIndicators(available, missing, directions)
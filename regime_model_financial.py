@@ -78,6 +78,14 @@ from pathlib import Path
 import pandas as pd
 import numpy as np
 
+from regime_common import (
+    composite_and_classify,
+    get_zscores,
+    log_regime_summary,
+    regime_labels,
+    resolve_indicators,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -113,25 +121,7 @@ REGIME_LABELS = {
 
 
 # ══════════════════════════════════════════════════════════════════════════════
-# 2. FUNCIONES AUXILIARES
-# ══════════════════════════════════════════════════════════════════════════════
-
-def _expanding_zscore(series: pd.Series, min_periods: int = 24) -> pd.Series:
-    """
-    Z-score expansivo: usa solo datos hasta la fecha actual.
-
-    z_t = (X_t - mean(X_1..X_t)) / std(X_1..X_t)
-
-    Sin look-ahead bias. Los primeros min_periods valores son NaN.
-    """
-    expanding_mean = series.expanding(min_periods=min_periods).mean()
-    expanding_std = series.expanding(min_periods=min_periods).std(ddof=1)
-    expanding_std = expanding_std.replace(0, np.nan)
-    return (series - expanding_mean) / expanding_std
-
-
-# ══════════════════════════════════════════════════════════════════════════════
-# 3. FUNCIÓN PRINCIPAL DEL MODELO
+# 2. FUNCIÓN PRINCIPAL DEL MODELO
 # ══════════════════════════════════════════════════════════════════════════════
 
 def classify_regime(
@@ -139,7 +129,8 @@ def classify_regime(
     min_periods: int = MIN_PERIODS,
     riskon_threshold: float = RISKON_THRESHOLD,
     riskoff_threshold: float = RISKOFF_THRESHOLD,
-) -> pd.DataFrame:
+    return_series_only: bool = False,
+) -> pd.DataFrame | pd.Series:
     """
     Clasifica el régimen de condiciones financieras para cada fecha.
 
@@ -153,77 +144,78 @@ def classify_regime(
         Umbral del composite para clasificar como risk-on.
     riskoff_threshold : float
         Umbral (negativo) para clasificar como risk-off.
+    return_series_only : bool
+        Si True, devuelve solo la serie regime_financial sin construir las
+        columnas de etiqueta y score (ruta de get_regime_series).
 
     Retorna
     -------
+    pd.Series regime_financial si return_series_only; si no,
     pd.DataFrame con columnas:
-        - regime_financial       : int (-1, 0, 1)
-        - regime_financial_label : str
+        - regime_financial       : Int8 (-1, 0, 1; <NA> sin datos)
+        - regime_financial_label : category (etiquetas de REGIME_LABELS)
         - regime_financial_score : float composite z-score
     """
     logger.info(f"[{MODEL_NAME}] Clasificando régimen de condiciones financieras...")
 
     # --- Verificar indicadores ---
-    available = [col for col in INDICATORS if col in indicators.columns]
-    missing = [col for col in INDICATORS if col not in indicators.columns]
+    # Disponibles/faltantes y direcciones, cacheados por conjunto de columnas
+    available, missing, directions = resolve_indicators(
+        tuple(INDICATORS.items()), frozenset(indicators.columns)
+    )
 
     if missing:
-        logger.warning(f"[{MODEL_NAME}] Indicadores faltantes: {missing}")
+        logger.warning(f"[{MODEL_NAME}] Indicadores faltantes: {list(missing)}")
     if not available:
         raise ValueError(
             f"[{MODEL_NAME}] Ningún indicador disponible. "
             f"Se requieren: {list(INDICATORS.keys())}"
         )
 
-    logger.info(f"[{MODEL_NAME}] Usando {len(available)}/{len(INDICATORS)} indicadores: {available}")
-
-    # --- Calcular z-scores dirigidos ---
-    directed_zscores = pd.DataFrame(index=indicators.index)
-
-    for col in available:
-        direction = INDICATORS[col]
-        raw_series = indicators[col]
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"[{MODEL_NAME}] Usando {len(available)}/{len(INDICATORS)} indicadores: {list(available)}")
+
+    # --- Z-scores dirigidos, composite y régimen (regime_common) ---
+    directed, composite_values, regime_values = composite_and_classify(
+        get_zscores(indicators, available, min_periods),
+        directions,
+        riskon_threshold,
+        riskoff_threshold,
+    )
+
+    # Diagnóstico por indicador: un solo recuento vectorizado sobre la matriz
+    # T×N, y ninguno si INFO está filtrado (p.ej. en barridos de parámetros)
+    if logger.isEnabledFor(logging.INFO):
+        n_valid_by_col = (~np.isnan(directed)).sum(axis=0)
+        for col, direction, n_valid in zip(available, directions, n_valid_by_col):
+            logger.info(
+                f"[{MODEL_NAME}]   {col:>40s} (dir={direction:+d}): "
+                f"{n_valid} obs válidas"
+            )
+
+    regime = pd.Series(regime_values, index=indicators.index, name="regime_financial")
 
-        zscore = _expanding_zscore(raw_series, min_periods=min_periods)
-        directed_zscores[col] = zscore * direction
-
-        n_valid = zscore.notna().sum()
-        logger.info(
-            f"[{MODEL_NAME}]   {col:>40s} (dir={direction:+d}): "
-            f"{n_valid} obs válidas"
-        )
-
-    # --- Composite score ---
-    composite = directed_zscores.mean(axis=1)
-
-    # --- Clasificar régimen ---
-    regime = pd.Series(0, index=indicators.index, dtype=int, name="regime_financial")
-    regime[composite > riskon_threshold] = 1
-    regime[composite < riskoff_threshold] = -1
-    regime[composite.isna()] = np.nan
+    # --- Log resumen ---
+    log_regime_summary(logger, MODEL_NAME, regime, REGIME_LABELS, label_width=12)
 
-    # --- Output ---
-    result = pd.DataFrame(index=indicators.index)
-    result["regime_financial"] = regime
-    result["regime_financial_label"] = regime.map(REGIME_LABELS)
-    result["regime_financial_score"] = composite
+    if return_series_only:
+        return regime
 
-    # --- Log resumen ---
-    valid_regimes = regime.dropna()
-    if len(valid_regimes) > 0:
-        counts = valid_regimes.value_counts().sort_index()
-        total = len(valid_regimes)
-        logger.info(f"[{MODEL_NAME}] Clasificación completada ({total} meses válidos):")
-        for val, count in counts.items():
-            label = REGIME_LABELS.get(int(val), "unknown")
-            pct = 100 * count / total
-            logger.info(f"[{MODEL_NAME}]   {int(val):+d} ({label:>12s}): {count:>4d} meses ({pct:5.1f}%)")
+    # --- Output (DataFrame de una vez, sin asignar columnas) ---
+    result = pd.DataFrame(
+        {
+            "regime_financial": regime,
+            "regime_financial_label": regime_labels(regime_values, REGIME_LABELS),
+            "regime_financial_score": composite_values,
+        },
+        index=indicators.index,
+    )
 
     return result
 
 
 # ══════════════════════════════════════════════════════════════════════════════
-# 4. INTERFAZ ESTÁNDAR
+# 3. INTERFAZ ESTÁNDAR
 # ══════════════════════════════════════════════════════════════════════════════
 
 def get_regime_series(indicators: pd.DataFrame) -> pd.Series:
@@ -232,5 +224,4 @@ def get_regime_series(indicators: pd.DataFrame) -> pd.Series:
 
     Punto de entrada para regime_selector.py.
     """
-    result = classify_regime(indicators)
-    return result["regime_financial"]
\ No newline at end of file
+    return classify_regime(indicators, return_series_only=True)
\ No newline at end of file
@@ -73,6 +73,14 @@ from pathlib import Path
 import pandas as pd
 import numpy as np
 
+from regime_common import (
+    composite_and_classify,
+    get_zscores,
+    log_regime_summary,
+    regime_labels,
+    resolve_indicators,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -111,43 +119,7 @@ VALIDATION_COL = "cycle_nber_recession"
 
 
 # ══════════════════════════════════════════════════════════════════════════════
-# 2. FUNCIONES AUXILIARES
-# ══════════════════════════════════════════════════════════════════════════════
-
-def _expanding_zscore(series: pd.Series, min_periods: int = 24) -> pd.Series:
-    """
-    Calcula el z-score expansivo de una serie.
-
-    Para cada fecha t, el z-score se calcula usando SOLO datos desde
-    el inicio hasta t (no datos futuros):
-
-        z_t = (X_t - mean(X_1..X_t)) / std(X_1..X_t)
-
-    Los primeros `min_periods` valores serán NaN porque no hay
-    suficientes datos para una estimación estable.
-
-    Parámetros
-    ----------
-    series : pd.Series
-        Serie temporal del indicador.
-    min_periods : int
-        Número mínimo de observaciones antes de calcular.
-
-    Retorna
-    -------
-    pd.Series : z-scores expansivos.
-    """
-    expanding_mean = series.expanding(min_periods=min_periods).mean()
-    expanding_std = series.expanding(min_periods=min_periods).std(ddof=1)
-
-    # Proteger contra std = 0 (serie constante)
-    expanding_std = expanding_std.replace(0, np.nan)
-
-    return (series - expanding_mean) / expanding_std
-
-
-# ══════════════════════════════════════════════════════════════════════════════
-# 3. FUNCIÓN PRINCIPAL DEL MODELO
+# 2. FUNCIÓN PRINCIPAL DEL MODELO
 # ══════════════════════════════════════════════════════════════════════════════
 
 def classify_regime(
@@ -155,7 +127,8 @@ def classify_regime(
     min_periods: int = MIN_PERIODS,
     expansion_threshold: float = EXPANSION_THRESHOLD,
     contraction_threshold: float = CONTRACTION_THRESHOLD,
-) -> pd.DataFrame:
+    return_series_only: bool = False,
+) -> pd.DataFrame | pd.Series:
     """
     Clasifica el régimen macroeconómico para cada fecha.
 
@@ -170,87 +143,83 @@ def classify_regime(
         Umbral del composite z-score para clasificar como expansión.
     contraction_threshold : float
         Umbral (negativo) para clasificar como contracción.
+    return_series_only : bool
+        Si True, devuelve solo la serie regime_macro sin construir las
+        columnas de etiqueta y score (ruta de get_regime_series).
 
     Retorna
     -------
+    pd.Series regime_macro si return_series_only; si no,
     pd.DataFrame con columnas:
-        - regime_macro       : int (-1, 0, 1) régimen clasificado
-        - regime_macro_label : str etiqueta legible
+        - regime_macro       : Int8 (-1, 0, 1; <NA> sin datos) régimen clasificado
+        - regime_macro_label : category etiqueta legible (REGIME_LABELS)
         - regime_macro_score : float composite z-score (para diagnóstico)
     """
     logger.info(f"[{MODEL_NAME}] Clasificando régimen macroeconómico...")
 
     # --- Verificar disponibilidad de indicadores ---
-    available = [col for col in INDICATORS if col in indicators.columns]
-    missing = [col for col in INDICATORS if col not in indicators.columns]
+    # Columnas como frozenset, construido una vez: clave de la caché de
+    # disponibles/faltantes/direcciones y pertenencia O(1) para VALIDATION_COL
+    col_set = frozenset(indicators.columns)
+    available, missing, directions = resolve_indicators(tuple(INDICATORS.items()), col_set)
 
     if missing:
-        logger.warning(f"[{MODEL_NAME}] Indicadores faltantes: {missing}")
+        logger.warning(f"[{MODEL_NAME}] Indicadores faltantes: {list(missing)}")
     if not available:
         raise ValueError(f"[{MODEL_NAME}] Ningún indicador disponible. Se requieren: {list(INDICATORS.keys())}")
 
-    logger.info(f"[{MODEL_NAME}] Usando {len(available)}/{len(INDICATORS)} indicadores: {available}")
-
-    # --- Calcular z-scores dirigidos ---
-    directed_zscores = pd.DataFrame(index=indicators.index)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"[{MODEL_NAME}] Usando {len(available)}/{len(INDICATORS)} indicadores: {list(available)}")
+
+    # --- Z-scores dirigidos, composite y régimen (regime_common) ---
+    # Z-score expansivo de todos los indicadores en una sola pasada 2D, sin
+    # look-ahead, con la dirección aplicada (z positivo SIEMPRE = condiciones
+    # favorables). El composite es la media (no la suma) de los disponibles,
+    # comparable sea cual sea su número, y el régimen se clasifica en una
+    # sola selección vectorizada (Int8, <NA> donde el composite es NaN).
+    directed, composite_values, regime_values = composite_and_classify(
+        get_zscores(indicators, available, min_periods),
+        directions,
+        expansion_threshold,
+        contraction_threshold,
+    )
+
+    # Diagnóstico por indicador: un solo recuento vectorizado sobre la matriz
+    # T×N, y ninguno si INFO está filtrado
+    if logger.isEnabledFor(logging.INFO):
+        n_valid_by_col = (~np.isnan(directed)).sum(axis=0)
+        for col, direction, n_valid in zip(available, directions, n_valid_by_col):
+            logger.info(
+                f"[{MODEL_NAME}]   {col:>35s} (dir={direction:+d}): "
+                f"{n_valid} obs válidas"
+            )
+
+    regime = pd.Series(regime_values, index=indicators.index, name="regime_macro")
 
-    for col in available:
-        direction = INDICATORS[col]
-        raw_series = indicators[col]
-
-        # Z-score expansivo (sin look-ahead)
-        zscore = _expanding_zscore(raw_series, min_periods=min_periods)
-
-        # Aplicar dirección: multiplicar por +1 o -1
-        # Resultado: z positivo SIEMPRE = condiciones favorables
-        directed_zscores[col] = zscore * direction
-
-        # Log de diagnóstico
-        n_valid = zscore.notna().sum()
-        logger.info(
-            f"[{MODEL_NAME}]   {col:>35s} (dir={direction:+d}): "
-            f"{n_valid} obs válidas"
-        )
-
-    # --- Composite score: promedio de z-scores dirigidos ---
-    # Se usa la media (no suma) para que el composite sea comparable
-    # independientemente del número de indicadores disponibles.
-    composite = directed_zscores.mean(axis=1)
-
-    # --- Clasificar régimen ---
-    regime = pd.Series(0, index=indicators.index, dtype=int, name="regime_macro")
-    regime[composite > expansion_threshold] = 1
-    regime[composite < contraction_threshold] = -1
+    # --- Log resumen ---
+    log_regime_summary(logger, MODEL_NAME, regime, REGIME_LABELS, label_width=12)
 
-    # Donde el composite es NaN (periodos iniciales), el régimen es NaN
-    regime[composite.isna()] = np.nan
+    if return_series_only:
+        return regime
 
-    # --- Construir output ---
-    result = pd.DataFrame(index=indicators.index)
-    result["regime_macro"] = regime
-    result["regime_macro_label"] = regime.map(REGIME_LABELS)
-    result["regime_macro_score"] = composite
+    # --- Construir output (DataFrame de una vez, sin asignar columnas) ---
+    columns = {
+        "regime_macro": regime,
+        "regime_macro_label": regime_labels(regime_values, REGIME_LABELS),
+        "regime_macro_score": composite_values,
+    }
 
     # Añadir NBER para validación si disponible (NO como input)
-    if VALIDATION_COL in indicators.columns:
-        result["nber_recession_validation"] = indicators[VALIDATION_COL]
+    if VALIDATION_COL in col_set:
+        columns["nber_recession_validation"] = indicators[VALIDATION_COL]
 
-    # --- Log resumen ---
-    valid_regimes = regime.dropna()
-    if len(valid_regimes) > 0:
-        counts = valid_regimes.value_counts().sort_index()
-        total = len(valid_regimes)
-        logger.info(f"[{MODEL_NAME}] Clasificación completada ({total} meses válidos):")
-        for val, count in counts.items():
-            label = REGIME_LABELS.get(int(val), "unknown")
-            pct = 100 * count / total
-            logger.info(f"[{MODEL_NAME}]   {int(val):+d} ({label:>12s}): {count:>4d} meses ({pct:5.1f}%)")
+    result = pd.DataFrame(columns, index=indicators.index)
 
     return result
 
 
 # ══════════════════════════════════════════════════════════════════════════════
-# 4. INTERFAZ ESTÁNDAR (usada por regime_selector.py)
+# 3. INTERFAZ ESTÁNDAR (usada por regime_selector.py)
 # ══════════════════════════════════════════════════════════════════════════════
 
 def get_regime_series(indicators: pd.DataFrame) -> pd.Series:
@@ -268,7 +237,6 @@ def get_regime_series(indicators: pd.DataFrame) -> pd.Series:
 
     Retorna
     -------
-    pd.Series : serie temporal de régimen (int: -1, 0, 1).
+    pd.Series : serie temporal de régimen (Int8: -1, 0, 1; <NA> sin datos).
     """
-    result = classify_regime(indicators)
-    return result["regime_macro"]
\ No newline at end of file
+    return classify_regime(indicators, return_series_only=True)
\ No newline at end of file
@@ -35,11 +35,14 @@ Fecha: 2026-02
 ================================================================================
 """
 
+import functools
 import importlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
@@ -53,6 +56,9 @@ INDICATORS_DIR = Path("data/indicators")
 REGIMES_DIR = Path("data/processed/regimes")
 INDICATORS_FILE = "indicators_full.csv"
 
+# Formato por defecto de los regímenes guardados (ver REGIME_WRITERS)
+DEFAULT_REGIME_FORMAT = "parquet"
+
 # ──────────────────────────────────────────────────────────────────────────────
 # REGISTRO DE MODELOS DISPONIBLES
 #
@@ -97,7 +103,14 @@ def load_indicators(
     """
     Carga el dataset completo de indicadores.
 
-    Lee indicators_full.csv generado por indicators.py (Paso 3).
+    Si indicators.py (Paso 3) ha dejado junto al CSV su copia Parquet
+    (indicators_full.parquet) y es más reciente que el CSV, se lee ella,
+    con tipos y fechas ya resueltos. Si no (copia ausente o CSV
+    regenerado después), se lee indicators_full.csv con el lector CSV de
+    pyarrow (multihilo). Esta función no escribe en disco.
+
+    Los valores se mantienen en float64: los regímenes comparan el
+    composite con umbrales y no deben depender del redondeo a float32.
 
     Parámetros
     ----------
@@ -117,7 +130,18 @@ def load_indicators(
             f"¿Se ejecutó indicators.py (Paso 3)?"
         )
 
-    df = pd.read_csv(filepath, index_col=0, parse_dates=True)
+    parquet_path = filepath.with_suffix(".parquet")
+    if (
+        parquet_path.exists()
+        and parquet_path.stat().st_mtime_ns >= filepath.stat().st_mtime_ns
+    ):
+        df = pd.read_parquet(parquet_path, engine="pyarrow")
+    else:
+        df = pd.read_csv(filepath, engine="pyarrow", index_col=0)
+        # Misma resolución (us) que el lector C con parse_dates, para que
+        # la carga desde CSV y desde la copia Parquet den el mismo índice
+        df.index = pd.to_datetime(df.index, cache=True).as_unit("us")
+
     logger.info(
         f"Indicadores cargados: {df.shape[0]} meses × {df.shape[1]} indicadores "
         f"desde {filepath}"
@@ -129,12 +153,41 @@ def load_indicators(
 # 3. FUNCIÓN PRINCIPAL: get_regime
 # ══════════════════════════════════════════════════════════════════════════════
 
+@functools.lru_cache(maxsize=None)
+def _load_model(module_name: str) -> Callable[[pd.DataFrame], pd.Series]:
+    """
+    Importa un módulo de régimen y devuelve su get_regime_series.
+
+    El resultado se cachea por nombre de módulo: en llamadas repetidas
+    (p.ej. get_all_regimes) no se repite la importación ni la comprobación
+    de la interfaz. Los errores no se cachean.
+    """
+    try:
+        regime_module = importlib.import_module(module_name)
+    except ImportError as e:
+        raise ImportError(
+            f"No se pudo importar el módulo '{module_name}'. "
+            f"¿Existe el archivo {module_name}.py? Error: {e}"
+        )
+
+    # Verificar que el módulo tiene la interfaz estándar
+    regime_fn = getattr(regime_module, "get_regime_series", None)
+    if regime_fn is None:
+        raise AttributeError(
+            f"El módulo '{module_name}' no implementa la función "
+            f"'get_regime_series(indicators)'. Todos los modelos de régimen "
+            f"deben implementar esta interfaz."
+        )
+    return regime_fn
+
+
 def get_regime(
     model: str,
     indicators: Optional[pd.DataFrame] = None,
     indicators_dir: Path = INDICATORS_DIR,
     save: bool = False,
     output_dir: Path = REGIMES_DIR,
+    save_format: str = DEFAULT_REGIME_FORMAT,
 ) -> pd.Series:
     """
     Selecciona y ejecuta un modelo de régimen.
@@ -164,9 +217,12 @@ def get_regime(
     output_dir : Path
         Directorio de salida para guardar (solo si save=True).
 
+    save_format : str
+        Formato del archivo guardado: "parquet" (por defecto) o "csv".
+
     Retorna
     -------
-    pd.Series : serie temporal de régimen (int: -1, 0, 1).
+    pd.Series : serie temporal de régimen (Int8: -1, 0, 1; <NA> sin datos).
 
     Raises
     ------
@@ -193,41 +249,31 @@ def get_regime(
     model_info = MODEL_REGISTRY[model]
     module_name = model_info["module"]
 
-    logger.info("=" * 70)
-    logger.info(f"REGIME SELECTOR — Modelo seleccionado: '{model}'")
-    logger.info(f"  Módulo: {module_name}")
-    logger.info(f"  {model_info['description']}")
-    logger.info("=" * 70)
+    # Las líneas de log (cabecera y recuento de meses válidos) se formatean
+    # solo si INFO está activo: en backtests con muchas llamadas se omiten.
+    log_info = logger.isEnabledFor(logging.INFO)
+
+    if log_info:
+        logger.info("=" * 70)
+        logger.info(f"REGIME SELECTOR — Modelo seleccionado: '{model}'")
+        logger.info(f"  Módulo: {module_name}")
+        logger.info(f"  {model_info['description']}")
+        logger.info("=" * 70)
 
     # --- Cargar indicadores si no se proporcionan ---
     if indicators is None:
         indicators = load_indicators(indicators_dir)
 
-    # --- Importar y ejecutar el modelo ---
-    try:
-        regime_module = importlib.import_module(module_name)
-    except ImportError as e:
-        raise ImportError(
-            f"No se pudo importar el módulo '{module_name}'. "
-            f"¿Existe el archivo {module_name}.py? Error: {e}"
-        )
-
-    # Verificar que el módulo tiene la interfaz estándar
-    if not hasattr(regime_module, "get_regime_series"):
-        raise AttributeError(
-            f"El módulo '{module_name}' no implementa la función "
-            f"'get_regime_series(indicators)'. Todos los modelos de régimen "
-            f"deben implementar esta interfaz."
-        )
-
-    # Ejecutar el modelo
-    regime_series = regime_module.get_regime_series(indicators)
+    # --- Importar (cacheado) y ejecutar el modelo ---
+    regime_fn = _load_model(module_name)
+    regime_series = regime_fn(indicators)
 
-    logger.info(f"\nRégimen '{model}' calculado: {regime_series.notna().sum()} meses válidos")
+    if log_info:
+        logger.info(f"\nRégimen '{model}' calculado: {regime_series.notna().sum()} meses válidos")
 
     # --- Guardar opcionalmente ---
     if save:
-        _save_regime(regime_series, model, output_dir)
+        _save_regime(regime_series, model, output_dir, save_format)
 
     return regime_series
 
@@ -236,15 +282,27 @@ def get_regime(
 # 4. FUNCIONES AUXILIARES
 # ══════════════════════════════════════════════════════════════════════════════
 
+# Formatos de guardado de regímenes: formato → función (df, ruta). El formato
+# es también la extensión del archivo.
+#   - "parquet" → columnar comprimido (zstd); conserva fechas y el Int8.
+#   - "csv"     → texto, como en versiones anteriores (DataFrame.to_csv).
+REGIME_WRITERS = {
+    "parquet": lambda df, path: df.to_parquet(path, engine="pyarrow", compression="zstd"),
+    "csv": lambda df, path: df.to_csv(path),
+}
+
+
 def _save_regime(
     regime: pd.Series,
     model_name: str,
     output_dir: Path = REGIMES_DIR,
+    save_format: str = DEFAULT_REGIME_FORMAT,
 ) -> Path:
     """
     Guarda la serie de régimen en disco.
 
-    Archivo generado: regime_{model_name}.csv
+    Archivo generado: regime_{model_name}.{save_format} (Parquet por
+    defecto, ver REGIME_WRITERS).
 
     Parámetros
     ----------
@@ -254,17 +312,25 @@ def _save_regime(
         Nombre del modelo (para el nombre del archivo).
     output_dir : Path
         Directorio de salida.
+    save_format : str
+        "parquet" o "csv".
 
     Retorna
     -------
     Path : ruta del archivo guardado.
     """
+    if save_format not in REGIME_WRITERS:
+        raise ValueError(
+            f"Formato '{save_format}' no soportado. "
+            f"Opciones disponibles: {list(REGIME_WRITERS)}"
+        )
+
     output_dir.mkdir(parents=True, exist_ok=True)
-    filepath = output_dir / f"regime_{model_name}.csv"
+    filepath = output_dir / f"regime_{model_name}.{save_format}"
 
     regime_df = regime.to_frame(name=f"regime_{model_name}")
     regime_df.index.name = "date"
-    regime_df.to_csv(filepath)
+    REGIME_WRITERS[save_format](regime_df, filepath)
 
     logger.info(f"  ✓ Régimen guardado: {filepath}")
     return filepath
@@ -284,6 +350,8 @@ def list_models() -> dict[str, str]:
 def get_all_regimes(
     indicators: Optional[pd.DataFrame] = None,
     save: bool = False,
+    save_format: str = DEFAULT_REGIME_FORMAT,
+    max_workers: int = 1,
 ) -> pd.DataFrame:
     """
     Ejecuta TODOS los modelos de régimen y devuelve un DataFrame
@@ -292,12 +360,24 @@ def get_all_regimes(
     Útil para comparación y diagnóstico, pero NO para combinar
     modelos en un ensemble (eso corresponde a fases posteriores).
 
+    Por defecto los modelos se ejecutan uno tras otro, en el orden de
+    MODEL_REGISTRY: cada uno son unos cientos de filas de NumPy y sus
+    diagnósticos en el log (la salida principal en la CLI) quedan
+    agrupados por modelo. Con max_workers > 1 se ejecutan en un pool de
+    hilos sobre el mismo DataFrame de indicadores (sin copias); las
+    columnas siguen el orden de MODEL_REGISTRY, pero las líneas de log
+    de los distintos modelos pueden intercalarse.
+
     Parámetros
     ----------
     indicators : pd.DataFrame, opcional
         Si no se proporciona, se carga automáticamente.
     save : bool
         Si True, guarda cada régimen individual.
+    save_format : str
+        Formato de los archivos guardados: "parquet" (por defecto) o "csv".
+    max_workers : int
+        Número de hilos. Por defecto 1: ejecución secuencial, sin pool.
 
     Retorna
     -------
@@ -312,14 +392,28 @@ def get_all_regimes(
 
     all_regimes = pd.DataFrame(index=indicators.index)
 
-    for model_name in MODEL_REGISTRY:
+    run_model = functools.partial(
+        get_regime, indicators=indicators, save=save, save_format=save_format
+    )
+    # Un callable por modelo que devuelve su serie (o lanza su error): en
+    # secuencial el modelo se ejecuta al llamarlo, dentro del bucle; en
+    # paralelo, future.result espera al hilo correspondiente.
+    if max_workers > 1 and len(MODEL_REGISTRY) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(MODEL_REGISTRY))) as executor:
+            futures = {
+                model_name: executor.submit(run_model, model=model_name)
+                for model_name in MODEL_REGISTRY
+            }
+        results = {model_name: future.result for model_name, future in futures.items()}
+    else:
+        results = {
+            model_name: functools.partial(run_model, model=model_name)
+            for model_name in MODEL_REGISTRY
+        }
+
+    for model_name, result in results.items():
         try:
-            regime = get_regime(
-                model=model_name,
-                indicators=indicators,
-                save=save,
-            )
-            all_regimes[f"regime_{model_name}"] = regime
+            all_regimes[f"regime_{model_name}"] = result()
         except Exception as e:
             logger.error(f"Error en modelo '{model_name}': {e}")
             continue
@@ -327,14 +421,19 @@ def get_all_regimes(
     all_regimes.index.name = "date"
 
     # --- Resumen de concordancia ---
-    valid_rows = all_regimes.dropna()
-    if len(valid_rows) > 0 and all_regimes.shape[1] > 1:
-        logger.info(f"\nConcordancia entre modelos ({len(valid_rows)} meses con datos completos):")
-        for col_a in all_regimes.columns:
-            for col_b in all_regimes.columns:
-                if col_a < col_b:
-                    agreement = (valid_rows[col_a] == valid_rows[col_b]).mean()
-                    logger.info(f"  {col_a} vs {col_b}: {agreement:.1%} concordancia")
+    # Solo alimenta el log: si INFO está filtrado no se calcula la matriz K×K
+    if logger.isEnabledFor(logging.INFO) and all_regimes.shape[1] > 1:
+        valid_rows = all_regimes.dropna()
+        if len(valid_rows) > 0:
+            logger.info(f"\nConcordancia entre modelos ({len(valid_rows)} meses con datos completos):")
+            # Matriz K×K de concordancia en una sola comparación vectorizada
+            values = valid_rows.to_numpy(dtype=np.int8)
+            agreement = (values[:, :, None] == values[:, None, :]).mean(axis=0)
+            cols = all_regimes.columns
+            for i, col_a in enumerate(cols):
+                for j, col_b in enumerate(cols):
+                    if col_a < col_b:
+                        logger.info(f"  {col_a} vs {col_b}: {agreement[i, j]:.1%} concordancia")
 
     return all_regimes
 
@@ -373,5 +472,7 @@ if __name__ == "__main__":
 
         # Guardar consolidado
         REGIMES_DIR.mkdir(parents=True, exist_ok=True)
-        all_regimes.to_csv(REGIMES_DIR / "regimes_all.csv")
+        REGIME_WRITERS[DEFAULT_REGIME_FORMAT](
+            all_regimes, REGIMES_DIR / f"regimes_all.{DEFAULT_REGIME_FORMAT}"
+        )
         logger.info(f"\n✓ Todos los regímenes guardados en {REGIMES_DIR}/")
\ No newline at end of file
@@ -0,0 +1,6 @@
+"""Los módulos del proyecto están en la raíz del repositorio."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,55 @@
+"""Tests de la carga de datos del Paso 3."""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators import _read_processed
+
+
+def _touch(path, seconds: int) -> None:
+    """Fija el mtime de path a una marca relativa, para ordenar archivos."""
+    ns = (1_700_000_000 + seconds) * 1_000_000_000
+    os.utime(path, ns=(ns, ns))
+
+
+@pytest.fixture
+def market() -> pd.DataFrame:
+    index = pd.date_range("2000-01-31", periods=12, freq="ME", name="date")
+    return pd.DataFrame({"SPY": np.linspace(100.0, 111.0, 12)}, index=index)
+
+
+@pytest.mark.parametrize("newest", ["parquet", "feather", "csv"])
+def test_reads_the_newest_format(tmp_path, market, newest):
+    writers = {
+        "parquet": lambda df, path: df.to_parquet(path),
+        "feather": lambda df, path: df.reset_index().to_feather(path),
+        "csv": lambda df, path: df.to_csv(path),
+    }
+    for offset, (ext, write) in enumerate(writers.items()):
+        path = tmp_path / f"market_monthly.{ext}"
+        # Solo el formato "newest" lleva los datos actuales
+        write(market if ext == newest else market * 2, path)
+        _touch(path, 10 if ext == newest else offset)
+
+    df = _read_processed(tmp_path, "market_monthly")
+
+    pd.testing.assert_frame_equal(df, market, check_freq=False)
+
+
+def test_same_mtime_prefers_parquet(tmp_path, market):
+    market.to_parquet(tmp_path / "market_monthly.parquet")
+    (market * 2).to_csv(tmp_path / "market_monthly.csv")
+    for ext in ("parquet", "csv"):
+        _touch(tmp_path / f"market_monthly.{ext}", 0)
+
+    df = _read_processed(tmp_path, "market_monthly")
+
+    pd.testing.assert_frame_equal(df, market, check_freq=False)
+
+
+def test_missing_dataset_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        _read_processed(tmp_path, "market_monthly")
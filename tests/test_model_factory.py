@@ -0,0 +1,115 @@
+"""Tests de la resolución de lógicas y la validación de indicadores."""
+
+from typing import Optional
+
+import pytest
+
+import model_factory
+from model_base import LOGIC_REGISTRY
+from model_factory import IndicatorContext, _load_available_indicators, _resolve_logic, create_model
+
+
+def _baseline_resolve(logic: str) -> Optional[tuple[str, type]]:
+    """Referencia: normalización original (lower + strip) y consulta al registro."""
+    key = logic.lower().strip()
+    return (key, LOGIC_REGISTRY[key]) if key in LOGIC_REGISTRY else None
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# TABLA DE DESPACHO DE LÓGICAS
+# ══════════════════════════════════════════════════════════════════════════════
+
+@pytest.mark.parametrize("key", sorted(LOGIC_REGISTRY))
+@pytest.mark.parametrize(
+    "variant",
+    [str, str.upper, str.title, lambda k: f"  {k} ", lambda k: f"\t{k.upper()}\n"],
+    ids=["exacta", "mayusculas", "titulo", "espacios", "tab"],
+)
+def test_resolve_logic_matches_normalized_lookup(key, variant):
+    logic = variant(key)
+    assert _resolve_logic(logic) == _baseline_resolve(logic)
+
+
+@pytest.mark.parametrize("logic", ["", "   ", "zscore", "no_existe", "zscore-composite"])
+def test_resolve_logic_unknown_is_none(logic):
+    assert _resolve_logic(logic) is None
+    assert _baseline_resolve(logic) is None
+
+
+def test_resolve_logic_sees_logics_registered_later(monkeypatch):
+    cls = next(iter(LOGIC_REGISTRY.values()))
+    monkeypatch.setitem(LOGIC_REGISTRY, "nueva_logica", cls)
+
+    assert _resolve_logic(" Nueva_Logica ") == ("nueva_logica", cls)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# CONTEXTO DE INDICADORES PARA CREACIÓN MASIVA
+# ══════════════════════════════════════════════════════════════════════════════
+
+INDICATORS = ["trend_momentum_6m", "cycle_indpro_yoy", "vol_vix_zscore_24m"]
+
+
+@pytest.fixture
+def indicators_dir(tmp_path):
+    (tmp_path / "indicators_full.csv").write_text(
+        "date," + ",".join(INDICATORS) + "\n2020-01-31,1,2,3\n"
+    )
+    return tmp_path
+
+
+def _spec(name: str, indicators: list[str]) -> dict:
+    return {
+        "name": name,
+        "indicators": indicators,
+        "logic": "zscore_composite",
+        "parameters": {
+            "directions": {ind: 1 for ind in indicators},
+            "threshold_buy": 0.5,
+            "threshold_sell": -0.5,
+        },
+    }
+
+
+def test_context_matches_per_call_lookup(indicators_dir):
+    ctx = IndicatorContext(indicators_dir)
+
+    assert ctx.available == _load_available_indicators(indicators_dir)
+    assert ctx.available_set == frozenset(INDICATORS)
+
+
+def test_context_reads_the_header_once(indicators_dir, monkeypatch):
+    calls = []
+    original = model_factory._load_available_indicators
+    monkeypatch.setattr(
+        model_factory,
+        "_load_available_indicators",
+        lambda *args: calls.append(args) or original(*args),
+    )
+
+    ctx = IndicatorContext(indicators_dir)
+    for i in range(5):
+        create_model(**_spec(f"m{i}", INDICATORS[: i % 3 + 1]), indicator_context=ctx)
+
+    assert len(calls) == 1
+
+
+def test_context_validation_matches_default(indicators_dir, monkeypatch):
+    monkeypatch.setattr(IndicatorContext.__init__, "__defaults__", (indicators_dir, "indicators_full.csv"))
+    spec = _spec("m", [INDICATORS[0], "no_existe"])
+
+    with pytest.raises(ValueError) as default_error:
+        create_model(**spec)
+    with pytest.raises(ValueError) as context_error:
+        create_model(**spec, indicator_context=IndicatorContext(indicators_dir))
+
+    assert str(context_error.value) == str(default_error.value)
+    assert "no_existe" in str(context_error.value)
+
+
+def test_context_without_file_skips_validation(tmp_path):
+    ctx = IndicatorContext(tmp_path)
+
+    assert ctx.available == []
+    model = create_model(**_spec("m", ["cualquiera"]), indicator_context=ctx)
+    assert model.indicators == ["cualquiera"]
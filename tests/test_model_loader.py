@@ -0,0 +1,91 @@
+"""Tests del listado de modelos guardados."""
+
+import os
+
+import pytest
+
+from model_loader import list_models
+
+
+def _baseline_list(models_dir) -> list[str]:
+    """Referencia: listado original con glob y sorted."""
+    if not models_dir.exists():
+        return []
+    return sorted(p.stem for p in models_dir.glob("*.json"))
+
+
+def _bump_mtime(path) -> None:
+    """Avanza el mtime de path un segundo (independiente de la resolución del FS)."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def models_dir(tmp_path):
+    directory = tmp_path / "models"
+    directory.mkdir()
+    for name in ("beta", "Alpha", "gamma"):
+        (directory / f"{name}.json").write_text("{}")
+    (directory / "notas.txt").write_text("")
+    (directory / "carpeta.json").mkdir()
+    return directory
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# CACHÉ POR mtime DEL DIRECTORIO
+# ══════════════════════════════════════════════════════════════════════════════
+
+def test_list_models_matches_glob_listing(models_dir):
+    (models_dir / "carpeta.json").rmdir()
+    assert list_models(models_dir) == _baseline_list(models_dir)
+
+
+def test_list_models_skips_directories_named_json(models_dir):
+    assert list_models(models_dir) == ["Alpha", "beta", "gamma"]
+
+
+def test_list_models_missing_directory(tmp_path):
+    assert list_models(tmp_path / "no_existe") == _baseline_list(tmp_path / "no_existe")
+
+
+def test_list_models_cache_invalidated_by_directory_mtime(models_dir):
+    assert list_models(models_dir) == ["Alpha", "beta", "gamma"]
+
+    (models_dir / "delta.json").write_text("{}")
+    (models_dir / "beta.json").unlink()
+    _bump_mtime(models_dir)
+
+    assert list_models(models_dir) == ["Alpha", "delta", "gamma"]
+
+
+def test_list_models_returns_independent_lists(models_dir):
+    first = list_models(models_dir)
+    first.append("mutado")
+    assert list_models(models_dir) == ["Alpha", "beta", "gamma"]
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# ORDENACIÓN OPCIONAL
+# ══════════════════════════════════════════════════════════════════════════════
+
+def test_unsorted_listing_has_the_same_names(models_dir):
+    (models_dir / "carpeta.json").rmdir()
+
+    unsorted = list_models(models_dir, sort=False)
+
+    assert sorted(unsorted) == _baseline_list(models_dir)
+    assert len(unsorted) == len(set(unsorted))
+
+
+def test_sort_flag_only_changes_order(models_dir):
+    unsorted = list_models(models_dir, sort=False)
+    assert list_models(models_dir, sort=True) == sorted(unsorted)
+    # Una llamada sin ordenar no altera el listado ordenado cacheado
+    assert list_models(models_dir) == ["Alpha", "beta", "gamma"]
+
+
+def test_list_saved_models_forwards_sort(models_dir):
+    from model_factory import list_saved_models
+
+    assert list_saved_models(models_dir) == list_models(models_dir)
+    assert sorted(list_saved_models(models_dir, sort=False)) == list_models(models_dir)
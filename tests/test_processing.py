@@ -0,0 +1,502 @@
+"""Tests de la persistencia (.sha) y de la lectura de raw del Paso 2."""
+
+import logging
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import processing
+from processing import (
+    FINGERPRINT_SUFFIX,
+    _read_raw,
+    load_and_normalize_index,
+    save_processed_datasets,
+)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# HUELLAS .sha: OMITIR DATASETS SIN CAMBIOS
+# ══════════════════════════════════════════════════════════════════════════════
+
+@pytest.fixture
+def datasets() -> dict[str, pd.DataFrame]:
+    index = pd.date_range("2000-01-31", periods=36, freq="ME", name="date")
+    rng = np.random.default_rng(0)
+    market = pd.DataFrame({"SPY": rng.normal(100, 5, 36), "VIX": rng.normal(20, 3, 36)}, index=index)
+    macro = pd.DataFrame({
+        "CPI": rng.normal(250, 1, 36),
+        "USREC": pd.array(rng.integers(0, 2, 36), dtype="Int8"),
+    }, index=index)
+    combined = pd.concat([market.add_prefix("MKT_"), macro.add_prefix("MAC_")], axis=1)
+    audit = pd.DataFrame({
+        "file": ["yf_SPY.csv", "fred_CPIAUCSL.csv"],
+        "source": ["yfinance", "FRED"],
+        "n_rows": [36, 36],
+        "columns": [["Adj Close", "Close"], ["CPIAUCSL"]],
+        "nans_per_column": [{"Adj Close": 0, "Close": 1}, {"CPIAUCSL": 0}],
+    })
+    return {"market_df": market, "macro_df": macro, "combined_df": combined, "audit_df": audit}
+
+
+def _mtimes(directory) -> dict[str, int]:
+    return {path.name: path.stat().st_mtime_ns for path in directory.iterdir()}
+
+
+def _skipped(caplog) -> set[str]:
+    return {
+        record.getMessage().split()[1]
+        for record in caplog.records
+        if "sin cambios" in record.getMessage()
+    }
+
+
+def test_unchanged_rerun_skips_every_dataset(tmp_path, datasets, caplog):
+    save_processed_datasets(**datasets, output_dir=tmp_path)
+    before = _mtimes(tmp_path)
+
+    caplog.set_level(logging.INFO, logger=processing.logger.name)
+    save_processed_datasets(**datasets, output_dir=tmp_path)
+
+    assert _mtimes(tmp_path) == before
+    assert _skipped(caplog) == {
+        "market_monthly.parquet",
+        "macro_monthly.parquet",
+        "combined_monthly_raw.parquet",
+        "audit_report.feather",
+    }
+    assert (tmp_path / f"market_monthly{FINGERPRINT_SUFFIX}").exists()
+    assert not (tmp_path / "market_monthly.csv").exists()
+
+
+def test_changed_data_is_rewritten(tmp_path, datasets):
+    save_processed_datasets(**datasets, output_dir=tmp_path)
+
+    datasets["market_df"] = datasets["market_df"] * 1.01
+    save_processed_datasets(**datasets, output_dir=tmp_path)
+
+    reloaded = pd.read_parquet(tmp_path / "market_monthly.parquet")
+    pd.testing.assert_frame_equal(reloaded, datasets["market_df"], check_freq=False)
+
+
+def test_deleted_csv_companion_is_rewritten(tmp_path, datasets, caplog):
+    save_processed_datasets(**datasets, output_dir=tmp_path, write_csv=True)
+    assert (tmp_path / "macro_monthly.csv").exists()
+
+    (tmp_path / "macro_monthly.csv").unlink()
+    caplog.set_level(logging.INFO, logger=processing.logger.name)
+    save_processed_datasets(**datasets, output_dir=tmp_path, write_csv=True)
+
+    assert (tmp_path / "macro_monthly.csv").exists()
+    assert "macro_monthly.parquet" not in _skipped(caplog)
+    assert "market_monthly.parquet" in _skipped(caplog)
+
+
+def test_csv_and_verbose_toggles_are_rewritten(tmp_path, datasets):
+    save_processed_datasets(**datasets, output_dir=tmp_path)
+
+    save_processed_datasets(**datasets, output_dir=tmp_path, write_csv=True, verbose=True)
+
+    assert (tmp_path / "market_monthly.csv").exists()
+    assert (tmp_path / "audit_report.csv").exists()
+
+
+def _age(directory) -> None:
+    """Retrasa una hora el mtime de todo el directorio, para detectar reescrituras."""
+    for path in directory.iterdir():
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 3600 * 1_000_000_000))
+
+
+def test_skip_unchanged_false_rewrites_everything(tmp_path, datasets, caplog):
+    save_processed_datasets(**datasets, output_dir=tmp_path)
+    _age(tmp_path)
+    before = _mtimes(tmp_path)
+
+    caplog.set_level(logging.INFO, logger=processing.logger.name)
+    save_processed_datasets(**datasets, output_dir=tmp_path, skip_unchanged=False)
+
+    after = _mtimes(tmp_path)
+    assert _skipped(caplog) == set()
+    assert all(after[name] > before[name] for name in before)
+
+
+def test_rerun_after_skip_matches_fresh_write(tmp_path, datasets):
+    rerun, fresh = tmp_path / "rerun", tmp_path / "fresh"
+    save_processed_datasets(**datasets, output_dir=rerun)
+    save_processed_datasets(**datasets, output_dir=rerun)
+    save_processed_datasets(**datasets, output_dir=fresh, skip_unchanged=False)
+
+    assert sorted(_mtimes(rerun)) == sorted(_mtimes(fresh))
+    for name in ("market_monthly", "macro_monthly", "combined_monthly_raw"):
+        pd.testing.assert_frame_equal(
+            pd.read_parquet(rerun / f"{name}.parquet"),
+            pd.read_parquet(fresh / f"{name}.parquet"),
+        )
+    pd.testing.assert_frame_equal(
+        pd.read_feather(rerun / "audit_report.feather"),
+        pd.read_feather(fresh / "audit_report.feather"),
+    )
+
+
+def test_format_change_is_rewritten(tmp_path, datasets):
+    save_processed_datasets(**datasets, output_dir=tmp_path)
+
+    save_processed_datasets(**datasets, output_dir=tmp_path, fmt="feather")
+
+    reloaded = pd.read_feather(tmp_path / "market_monthly.feather").set_index("date")
+    pd.testing.assert_frame_equal(reloaded, datasets["market_df"], check_freq=False)
+
+
+def test_interrupted_write_leaves_no_fingerprint(tmp_path, datasets, monkeypatch):
+    save_processed_datasets(**datasets, output_dir=tmp_path)
+    sha_path = tmp_path / f"market_monthly{FINGERPRINT_SUFFIX}"
+
+    def failing_writer(df, path):
+        raise OSError("disco lleno")
+
+    datasets["market_df"] = datasets["market_df"] * 1.01
+    monkeypatch.setitem(processing.PROCESSED_WRITERS, "parquet", failing_writer)
+    with pytest.raises(OSError):
+        save_processed_datasets(**datasets, output_dir=tmp_path, max_workers=1)
+    assert not sha_path.exists()
+
+    # Sin huella, la siguiente ejecución escribe aunque los datos coincidan
+    monkeypatch.undo()
+    save_processed_datasets(**datasets, output_dir=tmp_path)
+    assert sha_path.exists()
+    reloaded = pd.read_parquet(tmp_path / "market_monthly.parquet")
+    pd.testing.assert_frame_equal(reloaded, datasets["market_df"], check_freq=False)
+
+
+def test_parallel_writers_match_serial(tmp_path, datasets):
+    serial, parallel = tmp_path / "serial", tmp_path / "parallel"
+    save_processed_datasets(**datasets, output_dir=serial, max_workers=1)
+    save_processed_datasets(**datasets, output_dir=parallel)
+
+    for name in ("market_monthly", "macro_monthly", "combined_monthly_raw", "audit_report"):
+        sha = f"{name}{FINGERPRINT_SUFFIX}"
+        assert (serial / sha).read_text() == (parallel / sha).read_text()
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# LECTURA DE RAW: LECTOR pyarrow
+# ══════════════════════════════════════════════════════════════════════════════
+
+RAW_FILES = sorted((Path(__file__).resolve().parent.parent / "data/raw").glob("*.csv"))
+
+
+def _baseline_load(path) -> pd.DataFrame:
+    """Referencia: lector C de pandas y normalización original del índice."""
+    df = pd.read_csv(path, index_col=0, parse_dates=True)
+    if df.index.tz is not None:
+        df.index = df.index.tz_localize(None)
+    df = df[~df.index.duplicated(keep="first")].sort_index()
+    df.index.name = "date"
+    return df
+
+
+@pytest.mark.parametrize("path", RAW_FILES, ids=lambda p: p.name)
+def test_read_raw_matches_c_parser(path):
+    # El lector C de pandas no redondea siempre al float más cercano: se
+    # admite 1 ulp de diferencia
+    pd.testing.assert_frame_equal(
+        _read_raw(path),
+        pd.read_csv(path, index_col=0, parse_dates=True),
+        check_exact=False, rtol=1e-15, atol=0,
+    )
+
+
+@pytest.mark.parametrize("path", RAW_FILES, ids=lambda p: p.name)
+def test_load_and_normalize_index_matches_baseline(path):
+    pd.testing.assert_frame_equal(
+        load_and_normalize_index(path),
+        _baseline_load(path),
+        check_exact=False, rtol=1e-15, atol=0,
+    )
+
+
+def test_tz_offset_keeps_local_wall_time(tmp_path):
+    path = tmp_path / "yf_TEST.csv"
+    path.write_text(
+        "Date,Close\n"
+        "2020-01-31 00:00:00+01:00,1.0\n"
+        "2020-02-01 00:00:00+01:00,2.0\n"
+    )
+
+    df = load_and_normalize_index(path)
+
+    assert df.index.tz is None
+    assert list(df.index) == [pd.Timestamp("2020-01-31"), pd.Timestamp("2020-02-01")]
+
+
+def test_tz_offset_matches_baseline(tmp_path):
+    path = tmp_path / "yf_TEST.csv"
+    path.write_text(
+        "Date,Close\n"
+        "2020-01-31 23:30:00-05:00,1.0\n"
+        "2020-02-29 00:00:00-05:00,2.0\n"
+        "2020-02-29 00:00:00-05:00,3.0\n"
+    )
+
+    pd.testing.assert_frame_equal(load_and_normalize_index(path), _baseline_load(path))
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# LECTURA DE RAW: CACHÉ POR mtime
+# ══════════════════════════════════════════════════════════════════════════════
+
+def test_read_raw_is_cached_until_mtime_changes(tmp_path):
+    path = tmp_path / "fred_TEST.csv"
+    path.write_text("DATE,TEST\n2020-01-01,1.5\n2020-02-01,2.5\n")
+
+    first = _read_raw(path)
+    assert _read_raw(path) is first
+
+    path.write_text("DATE,TEST\n2020-01-01,1.5\n2020-02-01,9.5\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    second = _read_raw(path)
+    assert second is not first
+    assert second["TEST"].tolist() == [1.5, 9.5]
+
+
+def test_audit_and_processing_share_one_parse_per_file(tmp_path, monkeypatch):
+    raw_dir = tmp_path / "raw"
+    raw_dir.mkdir()
+    for path in RAW_FILES:
+        (raw_dir / path.name).write_bytes(path.read_bytes())
+
+    parsed = []
+    original = processing.pa_csv.read_csv
+    monkeypatch.setattr(
+        processing.pa_csv, "read_csv", lambda path, **kw: parsed.append(path) or original(path, **kw)
+    )
+
+    processing.run_full_audit(raw_dir=raw_dir)
+    processing.process_market_data(raw_dir=raw_dir)
+    processing.process_macro_data(raw_dir=raw_dir)
+
+    assert parsed
+    assert len(parsed) == len(set(parsed))
+
+
+def test_cached_frame_is_not_modified_by_normalization(tmp_path):
+    path = tmp_path / "yf_TEST.csv"
+    path.write_text(
+        "Date,Close\n"
+        "2020-02-03 00:00:00+01:00,2.0\n"
+        "2020-01-31 00:00:00+01:00,1.0\n"
+        "2020-01-31 00:00:00+01:00,9.0\n"
+    )
+    cached = _read_raw(path).copy()
+
+    first = load_and_normalize_index(path)
+    second = load_and_normalize_index(path)
+
+    pd.testing.assert_frame_equal(_read_raw(path), cached)
+    pd.testing.assert_frame_equal(first, second)
+    pd.testing.assert_frame_equal(first, _baseline_load(path))
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# ESTADÍSTICAS DE COBERTURA
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _coverage_reference(df: pd.DataFrame) -> pd.DataFrame:
+    """Referencia: bucle por columna con first/last_valid_index de pandas."""
+    return pd.DataFrame(
+        {
+            "n_valid": [df[col].notna().sum() for col in df.columns],
+            "n_nan": [df[col].isna().sum() for col in df.columns],
+            "first_valid": [df[col].first_valid_index() for col in df.columns],
+            "last_valid": [df[col].last_valid_index() for col in df.columns],
+        },
+        index=df.columns,
+    )
+
+
+@pytest.mark.parametrize("n_rows", [0, 1, 24])
+def test_coverage_stats_matches_per_column_loop(datasets, n_rows):
+    df = datasets["combined_df"].iloc[:n_rows].copy()
+    if n_rows > 1:
+        df.iloc[:3, 0] = np.nan
+        df.iloc[-2:, 1] = np.nan
+        df.iloc[:, 2] = np.nan
+        df.iloc[5, 3] = pd.NA
+
+    stats = processing._coverage_stats(df)
+    expected = _coverage_reference(df)
+
+    assert stats["n_valid"].tolist() == expected["n_valid"].tolist()
+    assert stats["n_nan"].tolist() == expected["n_nan"].tolist()
+    for col in ("first_valid", "last_valid"):
+        assert [None if pd.isna(v) else v for v in stats[col]] == [
+            None if pd.isna(v) else v for v in expected[col]
+        ]
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# NORMALIZACIÓN DE SERIES MENSUALES
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _baseline_normalize(series: pd.Series) -> pd.Series:
+    """Referencia: índice original vía Period (to_period/to_timestamp)."""
+    series = series.copy()
+    series.index = series.index.to_period("M").to_timestamp("M")
+    return series
+
+
+@pytest.mark.parametrize(
+    "dates",
+    [
+        pd.date_range("1990-01-01", periods=420, freq="MS"),
+        pd.DatetimeIndex(["2024-01-15", "2024-02-29 13:45", "2024-03-01", "2024-04-30 10:00"]),
+        pd.DatetimeIndex(["2023-12-31", "2024-02-01", "2024-02-01", "2025-06-30"]),
+        pd.DatetimeIndex([], dtype="datetime64[us]"),
+    ],
+    ids=["inicio_de_mes", "con_hora", "mixto_y_duplicados", "vacio"],
+)
+def test_normalize_monthly_index_matches_period_conversion(dates):
+    series = pd.Series(np.arange(len(dates), dtype=float), index=dates, name="CPI")
+
+    result = processing.normalize_monthly_index(series)
+
+    pd.testing.assert_series_equal(result, _baseline_normalize(series), check_freq=False)
+    assert series.index.equals(dates)
+
+
+@pytest.mark.parametrize(
+    "dates",
+    [
+        pd.date_range("1990-01-31", periods=420, freq="ME"),
+        pd.DatetimeIndex(["2024-01-31", "2024-02-29", "2024-02-29", "2024-05-31"]),
+    ],
+    ids=["fin_de_mes", "duplicados_y_huecos"],
+)
+def test_month_end_series_is_returned_unchanged(dates):
+    series = pd.Series(np.arange(len(dates), dtype=float), index=dates, name="CPI")
+
+    result = processing.normalize_monthly_index(series)
+
+    assert result is series
+    pd.testing.assert_series_equal(result, _baseline_normalize(series), check_freq=False)
+
+
+def test_month_end_with_time_is_not_short_circuited():
+    dates = pd.DatetimeIndex(["2024-01-31 16:00", "2024-02-29 16:00"])
+    series = pd.Series([1.0, 2.0], index=dates)
+
+    result = processing.normalize_monthly_index(series)
+
+    assert result is not series
+    pd.testing.assert_series_equal(result, _baseline_normalize(series), check_freq=False)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# RESAMPLING A MENSUAL
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _daily(start: str, periods: int, seed: int = 0, name: str = "SPY") -> pd.Series:
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(start, periods=periods, name="date")
+    return pd.Series(100 + rng.normal(size=periods).cumsum(), index=index, name=name)
+
+
+def _with_gaps(series: pd.Series) -> pd.Series:
+    """Quita dos meses completos y deja otro solo con NaN."""
+    month = series.index.to_period("M")
+    series = series[(month != month[40]) & (month != month[41])].copy()
+    series[series.index.to_period("M") == month[100]] = np.nan
+    return series
+
+
+@pytest.mark.parametrize("method", ["last", "mean"])
+@pytest.mark.parametrize(
+    "series",
+    [
+        _daily("2000-01-03", 500),
+        _with_gaps(_daily("2000-01-03", 500)),
+        _daily("2020-03-16", 1),
+        _daily("2020-03-16", 0),
+    ],
+    ids=["diaria", "meses_sin_datos", "una_obs", "vacia"],
+)
+def test_resample_to_monthly_matches_resample(series, method):
+    result = processing.resample_to_monthly(series, method=method)
+    expected = getattr(series.resample("ME"), method)()
+
+    pd.testing.assert_series_equal(result, expected, check_freq=False)
+
+
+@pytest.mark.parametrize("method", ["last", "mean"])
+def test_resample_to_monthly_frame_matches_resample(method):
+    df = pd.concat(
+        [_with_gaps(_daily("2000-01-03", 500)), _daily("2000-06-01", 200, seed=1, name="TLT")],
+        axis=1, sort=True,
+    )
+
+    result = processing.resample_to_monthly(df, method=method)
+    expected = getattr(df.resample("ME"), method)()
+
+    pd.testing.assert_frame_equal(result, expected, check_freq=False)
+
+
+def test_resample_to_monthly_rejects_unknown_method():
+    with pytest.raises(ValueError):
+        processing.resample_to_monthly(_daily("2000-01-03", 10), method="median")
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# RESAMPLING EN LOTE POR MÉTODO
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _baseline_resample(series: pd.Series, method: str) -> pd.Series:
+    """Referencia: resamplear cada serie por separado, como el pipeline original."""
+    return getattr(series.resample("ME"), method)()
+
+
+@pytest.fixture
+def daily_batch() -> dict[str, pd.Series]:
+    """Series con rangos distintos, huecos, una sola observación y una vacía."""
+    return {
+        "SPY": _daily("2000-01-03", 500),
+        "TLT": _daily("2000-06-01", 200, seed=1),
+        "GLD": _with_gaps(_daily("1999-11-15", 450, seed=2)),
+        "DXY": _daily("2001-02-05", 1, seed=3),
+        "VIX": _daily("2001-02-05", 0),
+        "OIL": _daily("2000-03-10", 300, seed=4),
+    }
+
+
+@pytest.mark.parametrize(
+    "methods",
+    [
+        {"SPY": "last", "TLT": "last", "GLD": "last", "DXY": "last", "VIX": "last", "OIL": "last"},
+        {"SPY": "last", "TLT": "mean", "GLD": "mean", "DXY": "last", "VIX": "mean", "OIL": "last"},
+    ],
+    ids=["un_metodo", "metodos_mixtos"],
+)
+def test_resample_batch_matches_per_series(daily_batch, methods):
+    result = processing._resample_batch(daily_batch, methods)
+
+    assert list(result) == list(daily_batch)
+    for key, series in daily_batch.items():
+        expected = _baseline_resample(series, methods[key]).rename(key)
+        pd.testing.assert_series_equal(result[key], expected, check_freq=False, obj=key)
+
+
+def test_resample_batch_trims_each_column_to_its_own_range(daily_batch):
+    methods = dict.fromkeys(daily_batch, "last")
+
+    result = processing._resample_batch(daily_batch, methods)
+
+    # El join ancho cubre el rango de todas las series; cada columna conserva el suyo
+    assert result["TLT"].index[0] == pd.Timestamp("2000-06-30")
+    assert result["TLT"].index[-1] == pd.Timestamp("2001-03-31")
+    assert result["GLD"].index[0] == pd.Timestamp("1999-11-30")
+    assert len(result["DXY"]) == 1
+    assert result["VIX"].empty
@@ -0,0 +1,105 @@
+"""Tests del z-score expansivo compartido por los modelos de régimen."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from regime_common import expanding_zscore_values
+
+MIN_PERIODS = 24
+
+
+def _pandas_zscore(df: pd.DataFrame, min_periods: int) -> pd.DataFrame:
+    """Referencia: expanding().mean()/std() de pandas, desviación nula → NaN."""
+    expanding = df.expanding(min_periods=min_periods)
+    std = expanding.std()
+    return (df - expanding.mean()) / std.where(std > 0)
+
+
+@pytest.fixture
+def panel() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    n = 300
+    df = pd.DataFrame({
+        "ruido": rng.normal(size=n),
+        # Media grande frente a la dispersión (niveles tipo CPI/INDPRO)
+        "nivel": 250.0 + np.cumsum(rng.normal(scale=0.1, size=n)),
+        "con_nans": rng.normal(size=n),
+        "inicio_tardio": rng.normal(size=n),
+    })
+    df.loc[df.sample(frac=0.2, random_state=1).index, "con_nans"] = np.nan
+    df.loc[: n // 2, "inicio_tardio"] = np.nan
+    return df
+
+
+def test_matches_pandas_expanding(panel):
+    result = expanding_zscore_values(panel.to_numpy(), min_periods=MIN_PERIODS)
+    expected = _pandas_zscore(panel, MIN_PERIODS).to_numpy()
+
+    np.testing.assert_array_equal(np.isnan(result), np.isnan(expected))
+    np.testing.assert_allclose(result, expected, rtol=1e-9, atol=1e-12, equal_nan=True)
+
+
+def test_1d_input_keeps_shape(panel):
+    series = panel["ruido"]
+    result = expanding_zscore_values(series.to_numpy(), min_periods=MIN_PERIODS)
+    expected = _pandas_zscore(series.to_frame(), MIN_PERIODS)["ruido"].to_numpy()
+
+    assert result.shape == series.shape
+    np.testing.assert_allclose(result, expected, rtol=1e-9, atol=1e-12, equal_nan=True)
+
+
+def test_constant_stretch_is_nan():
+    values = np.r_[np.full(40, 3.0), np.arange(1.0, 21.0)]
+    result = expanding_zscore_values(values, min_periods=MIN_PERIODS)
+
+    # Tramo constante: desviación exactamente 0 → NaN, no ±inf
+    assert np.isnan(result[:40]).all()
+    assert np.isfinite(result[40:]).all()
+
+
+def test_short_history_is_all_nan():
+    rng = np.random.default_rng(2)
+    short = rng.normal(size=(MIN_PERIODS - 1, 3))
+    assert np.isnan(expanding_zscore_values(short, min_periods=MIN_PERIODS)).all()
+
+    sparse = rng.normal(size=(100, 2))
+    sparse[MIN_PERIODS - 1:, 1] = np.nan
+    result = expanding_zscore_values(sparse, min_periods=MIN_PERIODS)
+    assert np.isnan(result[:, 1]).all()
+    assert np.isfinite(result[MIN_PERIODS - 1:, 0]).all()
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# EQUIVALENCIA CON EL Z-SCORE ORIGINAL DE LOS MODELOS
+# ══════════════════════════════════════════════════════════════════════════════
+
+INDICATORS_CSV = Path(__file__).resolve().parent.parent / "data/indicators/indicators_full.csv"
+
+
+def _baseline_expanding_zscore(series: pd.Series, min_periods: int = 24) -> pd.Series:
+    """Referencia: _expanding_zscore que cada modelo calculaba columna a columna."""
+    expanding_mean = series.expanding(min_periods=min_periods).mean()
+    expanding_std = series.expanding(min_periods=min_periods).std(ddof=1)
+    expanding_std = expanding_std.replace(0, np.nan)
+    return (series - expanding_mean) / expanding_std
+
+
+def _assert_matches_baseline(df: pd.DataFrame, min_periods: int) -> None:
+    result = expanding_zscore_values(df.to_numpy(np.float64), min_periods=min_periods)
+    for j, col in enumerate(df.columns):
+        expected = _baseline_expanding_zscore(df[col], min_periods=min_periods).to_numpy()
+        np.testing.assert_array_equal(np.isnan(result[:, j]), np.isnan(expected), err_msg=col)
+        np.testing.assert_allclose(result[:, j], expected, rtol=1e-9, atol=1e-12, equal_nan=True, err_msg=col)
+
+
+@pytest.mark.parametrize("min_periods", [2, MIN_PERIODS, 60])
+def test_matches_baseline_per_column_zscore(panel, min_periods):
+    _assert_matches_baseline(panel, min_periods)
+
+
+def test_matches_baseline_on_pipeline_indicators():
+    indicators = pd.read_csv(INDICATORS_CSV, index_col=0, parse_dates=True)
+    _assert_matches_baseline(indicators.select_dtypes("number"), MIN_PERIODS)
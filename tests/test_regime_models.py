@@ -0,0 +1,115 @@
+"""Tests de los modelos de régimen sobre los indicadores del repositorio."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import regime_model_financial
+import regime_model_liquidity
+import regime_model_macro
+
+INDICATORS_CSV = Path(__file__).resolve().parent.parent / "data/indicators/indicators_full.csv"
+MODELS = [regime_model_financial, regime_model_liquidity, regime_model_macro]
+
+
+@pytest.fixture
+def indicators() -> pd.DataFrame:
+    return pd.read_csv(INDICATORS_CSV, index_col=0, parse_dates=True)
+
+
+@pytest.mark.parametrize("model", MODELS, ids=lambda m: m.MODEL_NAME)
+def test_reassigned_column_changes_the_result(model, indicators):
+    score_col = f"regime_{model.MODEL_NAME}_score"
+    before = model.classify_regime(indicators)
+
+    # Reasignar una columna del mismo DataFrame (no una copia)
+    col = next(iter(model.INDICATORS))
+    indicators[col] = -indicators[col] * 5
+    after = model.classify_regime(indicators)
+
+    fresh = model.classify_regime(indicators.copy())
+    pd.testing.assert_frame_equal(after, fresh)
+    assert not after[score_col].equals(before[score_col])
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# RÉGIMEN EN Int8: EQUIVALENCIA CON LA CLASIFICACIÓN ORIGINAL (float + NaN)
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _baseline_regime(model, indicators: pd.DataFrame, upper: float, lower: float):
+    """
+    Referencia: clasificación original columna a columna con pandas.
+
+    Z-score expansivo por indicador, dirección aplicada, composite con
+    DataFrame.mean(axis=1) y régimen en float64 con NaN donde el composite
+    es NaN (el original lo obtenía asignando NaN a una serie int).
+    """
+    directed = pd.DataFrame(index=indicators.index)
+    for col, direction in model.INDICATORS.items():
+        if col not in indicators.columns:
+            continue
+        series = indicators[col]
+        expanding = series.expanding(min_periods=model.MIN_PERIODS)
+        std = expanding.std(ddof=1).replace(0, np.nan)
+        directed[col] = (series - expanding.mean()) / std * direction
+
+    composite = directed.mean(axis=1)
+    regime = pd.Series(
+        np.select([composite > upper, composite < lower], [1.0, -1.0], default=0.0),
+        index=indicators.index,
+    )
+    regime[composite.isna()] = np.nan
+    return regime, composite
+
+
+@pytest.mark.parametrize("thresholds", [(0.5, -0.5), (0.1, -0.8)], ids=["por_defecto", "asimetricos"])
+@pytest.mark.parametrize("model", MODELS, ids=lambda m: m.MODEL_NAME)
+def test_int8_regime_matches_float_baseline(model, indicators, thresholds):
+    upper, lower = thresholds
+    name = f"regime_{model.MODEL_NAME}"
+
+    result = model.classify_regime(indicators, model.MIN_PERIODS, upper, lower)
+    expected_regime, expected_score = _baseline_regime(model, indicators, upper, lower)
+
+    assert result[name].dtype == "Int8"
+    np.testing.assert_array_equal(
+        result[name].to_numpy(dtype=np.float64, na_value=np.nan), expected_regime.to_numpy()
+    )
+    np.testing.assert_allclose(
+        result[f"{name}_score"].to_numpy(), expected_score.to_numpy(), rtol=1e-9, atol=1e-12
+    )
+
+
+@pytest.mark.parametrize("model", MODELS, ids=lambda m: m.MODEL_NAME)
+def test_regime_series_matches_frame_column(model, indicators):
+    name = f"regime_{model.MODEL_NAME}"
+
+    series = model.get_regime_series(indicators)
+
+    pd.testing.assert_series_equal(series, model.classify_regime(indicators)[name])
+    assert series.name == name
+    assert series.isna().any() and series.notna().any()
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# ETIQUETAS COMO Categorical
+# ══════════════════════════════════════════════════════════════════════════════
+
+@pytest.mark.parametrize("model", MODELS, ids=lambda m: m.MODEL_NAME)
+def test_labels_match_dictionary_map(model, indicators):
+    name = f"regime_{model.MODEL_NAME}"
+    result = model.classify_regime(indicators)
+
+    labels = result[f"{name}_label"]
+    # Referencia: map del diccionario sobre el régimen en float (NaN → NaN)
+    expected = result[name].astype("float64").map(model.REGIME_LABELS)
+
+    assert isinstance(labels.dtype, pd.CategoricalDtype)
+    assert list(labels.cat.categories) == [model.REGIME_LABELS[k] for k in (-1, 0, 1)]
+    pd.testing.assert_series_equal(
+        labels.astype(object).where(labels.notna(), np.nan), expected.astype(object), check_names=False
+    )
+    # Escrito en CSV, el Categorical produce el mismo texto que las etiquetas str
+    assert labels.to_csv() == expected.rename(labels.name).to_csv()
@@ -0,0 +1,223 @@
+"""Tests del selector de regímenes (get_all_regimes y carga de indicadores)."""
+
+import logging
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import regime_selector
+from indicators import save_indicators
+from regime_selector import MODEL_REGISTRY, _save_regime, get_all_regimes, load_indicators
+
+INDICATORS_CSV = Path(__file__).resolve().parent.parent / "data/indicators/indicators_full.csv"
+
+
+@pytest.fixture
+def indicators() -> pd.DataFrame:
+    return pd.read_csv(INDICATORS_CSV, index_col=0, parse_dates=True)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# CARGA DE INDICADORES: CSV O COPIA PARQUET
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _set_mtime(path, seconds: int) -> None:
+    ns = (1_700_000_000 + seconds) * 1_000_000_000
+    os.utime(path, ns=(ns, ns))
+
+
+def _assert_matches_read_csv(df: pd.DataFrame, path: Path) -> None:
+    """
+    Compara con la lectura original read_csv(parse_dates=True).
+
+    El lector de pyarrow redondea siempre al float más cercano: coincide
+    exactamente con float_precision="round_trip". El lector C por defecto
+    no, y con 17 cifras significativas se separa hasta ~1e-12 relativo.
+    """
+    exact = pd.read_csv(path, index_col=0, parse_dates=True, float_precision="round_trip")
+    pd.testing.assert_frame_equal(df, exact)
+    baseline = pd.read_csv(path, index_col=0, parse_dates=True)
+    pd.testing.assert_frame_equal(df, baseline, check_exact=False, rtol=1e-12, atol=0)
+
+
+@pytest.fixture
+def indicators_dir(tmp_path, indicators) -> Path:
+    """Directorio con el CSV de indicadores del repositorio y su copia Parquet."""
+    shutil.copy(INDICATORS_CSV, tmp_path / INDICATORS_CSV.name)
+    indicators.to_parquet(tmp_path / "indicators_full.parquet")
+    return tmp_path
+
+
+def test_csv_only_matches_read_csv(tmp_path):
+    shutil.copy(INDICATORS_CSV, tmp_path / INDICATORS_CSV.name)
+
+    df = load_indicators(tmp_path)
+
+    _assert_matches_read_csv(df, INDICATORS_CSV)
+    # Solo lectura: no deja copia Parquet ni otros archivos
+    assert [p.name for p in tmp_path.iterdir()] == [INDICATORS_CSV.name]
+
+
+def test_newer_parquet_is_read(indicators_dir, indicators):
+    # CSV con datos distintos pero más antiguo: se ignora
+    (indicators * 2).to_csv(indicators_dir / "indicators_full.csv")
+    _set_mtime(indicators_dir / "indicators_full.csv", 0)
+    _set_mtime(indicators_dir / "indicators_full.parquet", 10)
+
+    df = load_indicators(indicators_dir)
+
+    pd.testing.assert_frame_equal(df, indicators)
+
+
+def test_csv_regenerated_after_parquet_is_read(indicators_dir, indicators):
+    (indicators * 2).to_parquet(indicators_dir / "indicators_full.parquet")
+    _set_mtime(indicators_dir / "indicators_full.parquet", 0)
+    _set_mtime(indicators_dir / "indicators_full.csv", 10)
+
+    df = load_indicators(indicators_dir)
+
+    _assert_matches_read_csv(df, INDICATORS_CSV)
+
+
+def test_missing_csv_raises_even_with_parquet(indicators_dir):
+    (indicators_dir / "indicators_full.csv").unlink()
+
+    with pytest.raises(FileNotFoundError):
+        load_indicators(indicators_dir)
+
+
+def test_save_indicators_roundtrip_matches_read_csv(tmp_path, indicators):
+    metadata = pd.DataFrame({"indicator": indicators.columns})
+    save_indicators(indicators, metadata, output_dir=tmp_path)
+
+    from_parquet = load_indicators(tmp_path)
+    (tmp_path / "indicators_full.parquet").unlink()
+    from_csv = load_indicators(tmp_path)
+
+    pd.testing.assert_frame_equal(from_parquet, indicators)
+    _assert_matches_read_csv(from_csv, tmp_path / "indicators_full.csv")
+    assert not any(p.name.startswith(".") for p in tmp_path.iterdir())
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# get_all_regimes: EJECUCIÓN SECUENCIAL / EN PARALELO
+# ══════════════════════════════════════════════════════════════════════════════
+
+def test_default_run_keeps_model_logs_in_registry_order(indicators, caplog):
+    caplog.set_level(logging.INFO)
+    get_all_regimes(indicators)
+
+    # Módulo de cada línea de log de los modelos, sin repeticiones seguidas
+    modules = [MODEL_REGISTRY[name]["module"] for name in MODEL_REGISTRY]
+    sequence = []
+    for record in caplog.records:
+        if record.name in modules and (not sequence or sequence[-1] != record.name):
+            sequence.append(record.name)
+    assert sequence == modules
+
+
+def test_parallel_run_matches_sequential(indicators):
+    sequential = get_all_regimes(indicators)
+    parallel = get_all_regimes(indicators, max_workers=len(MODEL_REGISTRY))
+
+    pd.testing.assert_frame_equal(parallel, sequential)
+    assert list(sequential.columns) == [f"regime_{name}" for name in MODEL_REGISTRY]
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_empty_registry_returns_empty_frame(indicators, monkeypatch, max_workers):
+    monkeypatch.setattr(regime_selector, "MODEL_REGISTRY", {})
+
+    result = get_all_regimes(indicators, max_workers=max_workers)
+
+    assert result.shape == (len(indicators), 0)
+    assert result.index.equals(indicators.index)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# GUARDADO DE REGÍMENES
+# ══════════════════════════════════════════════════════════════════════════════
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        pd.array([1, 0, None, -1], dtype="Int8"),
+        [1.0, 0.5, float("nan"), -1.0],
+    ],
+    ids=["Int8", "float"],
+)
+def test_csv_regime_matches_to_csv(tmp_path, values):
+    index = pd.DatetimeIndex(
+        ["2020-01-31", "2020-02-29", "2020-03-31 12:30", "2020-04-30"], name="date"
+    )
+    regime = pd.Series(values, index=index)
+
+    path = _save_regime(regime, "test", output_dir=tmp_path, save_format="csv")
+
+    expected = regime.to_frame(name="regime_test").to_csv()
+    assert path.read_text() == expected
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# CONCORDANCIA ENTRE MODELOS
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _baseline_concordance(all_regimes: pd.DataFrame) -> list[str]:
+    """Referencia: bucle original por pares con una comparación de Series cada uno."""
+    valid_rows = all_regimes.dropna()
+    lines = [f"\nConcordancia entre modelos ({len(valid_rows)} meses con datos completos):"]
+    for col_a in all_regimes.columns:
+        for col_b in all_regimes.columns:
+            if col_a < col_b:
+                agreement = (valid_rows[col_a] == valid_rows[col_b]).mean()
+                lines.append(f"  {col_a} vs {col_b}: {agreement:.1%} concordancia")
+    return lines
+
+
+def _concordance_lines(caplog) -> list[str]:
+    messages = [r.getMessage() for r in caplog.records if r.name == regime_selector.logger.name]
+    start = next(
+        (i for i, m in enumerate(messages) if m.startswith("\nConcordancia")), len(messages)
+    )
+    return messages[start:]
+
+
+def test_concordance_log_matches_pairwise_loop(indicators, caplog):
+    caplog.set_level(logging.INFO)
+
+    all_regimes = get_all_regimes(indicators)
+
+    lines = _concordance_lines(caplog)
+    assert lines == _baseline_concordance(all_regimes)
+    assert len(lines) == 1 + len(MODEL_REGISTRY) * (len(MODEL_REGISTRY) - 1) // 2
+
+
+def test_concordance_matches_pairwise_loop_on_synthetic_regimes(monkeypatch, caplog):
+    # Cuatro modelos con nombres no ordenados y un tramo sin datos en uno
+    rng = np.random.default_rng(0)
+    index = pd.date_range("2000-01-31", periods=200, freq="ME", name="date")
+    series = {
+        name: pd.Series(pd.array(rng.integers(-1, 2, 200), dtype="Int8"), index=index)
+        for name in ("d", "c", "a", "b")
+    }
+    series["c"].iloc[:30] = pd.NA
+    monkeypatch.setattr(regime_selector, "MODEL_REGISTRY", dict.fromkeys(series, {}))
+    monkeypatch.setattr(regime_selector, "get_regime", lambda model, **kwargs: series[model])
+    caplog.set_level(logging.INFO)
+
+    all_regimes = get_all_regimes(pd.DataFrame(index=index))
+
+    assert _concordance_lines(caplog) == _baseline_concordance(all_regimes)
+    assert "(170 meses con datos completos)" in _concordance_lines(caplog)[0]
+
+
+def test_concordance_skipped_when_info_filtered(indicators, caplog):
+    caplog.set_level(logging.WARNING)
+
+    get_all_regimes(indicators)
+
+    assert not any("Concordancia" in r.getMessage() for r in caplog.records)